@@ -0,0 +1,48 @@
+import pandas as pd
+
+from benchmarks.data import roster_csv
+from benchmarks.harness import benchmark
+from directory import EmployeeDirectory
+
+ROSTER_SIZES = [1_000, 10_000, 100_000]
+
+
+def login_target(size):
+    # An employee halfway down the roster, so a scan has to cover half of it
+    number = size // 2
+    return f"Employee {number}", f"E{number:06d}"
+
+
+@benchmark("login.authenticate", ROSTER_SIZES)
+def authenticate(size):
+    directory = EmployeeDirectory.parse(roster_csv(size))
+    name, code = login_target(size)
+
+    def login():
+        employee = directory.authenticate(name, code)
+        return employee.name, employee.code, employee.designation
+    return login
+
+
+@benchmark("login.authenticate_shared_name", ROSTER_SIZES)
+def authenticate_shared_name(size):
+    # roster_csv gives every 50th name to two employees; the passkey picks the second one
+    directory = EmployeeDirectory.parse(roster_csv(size))
+    number = size // 2 // 50 * 50 + 1
+    name, code = f"Employee {number - 1}", f"E{number:06d}"
+    return lambda: directory.authenticate(name, code)
+
+
+@benchmark("login.dataframe_scan", ROSTER_SIZES)
+def dataframe_scan(size):
+    # The lookups EmployeeDirectory replaced: three boolean masks over the Person frame
+    person = pd.read_csv(roster_csv(size), dtype=str)
+    name, code = login_target(size)
+
+    def login():
+        employee_code = person[person["Employee Name"] == name]["Employee Code"].iloc[0]
+        if employee_code != code:
+            return None
+        designation = person[person["Employee Name"] == name]["Designation"].iloc[0]
+        return person[person["Employee Name"] == name]["Employee Name"].iloc[0], employee_code, designation
+    return login
@@ -0,0 +1,29 @@
+from benchmarks.bench_storage import EMPLOYEE, sheet_store, sqlite_store
+from benchmarks.data import ticket_rows
+from benchmarks.harness import benchmark
+from storage import TICKET_SCHEMA
+
+# The ticket search box: an admin query across every ticket and an employee's
+# query over their own with a status filter, against the sheet store's index and SQLite's
+SEARCH_SIZES = [10_000, 100_000, 500_000]
+QUICK_SEARCH_SIZES = [10_000, 100_000]
+
+
+def ticket_search(store):
+    store.search("laptop charg", limit=500)
+    store.search("printer", limit=50)
+    return store.search("vpn", employee_code=EMPLOYEE, filters={"Status": "Open"})
+
+
+@benchmark("search.tickets.sheet", SEARCH_SIZES, QUICK_SEARCH_SIZES)
+def sheet_search(size):
+    store = sheet_store(TICKET_SCHEMA, ticket_rows(size))
+    ticket_search(store)
+    return lambda: ticket_search(store)
+
+
+@benchmark("search.tickets.sqlite", SEARCH_SIZES, QUICK_SEARCH_SIZES)
+def sqlite_search(size):
+    store = sqlite_store(TICKET_SCHEMA, ticket_rows(size), "search")
+    ticket_search(store)
+    return lambda: ticket_search(store)
@@ -0,0 +1,137 @@
+import threading
+from datetime import datetime, timedelta
+from itertools import count
+
+import pandas as pd
+
+from benchmarks.data import booking_rows, new_booking, new_ticket, ticket_rows
+from benchmarks.harness import benchmark, scratch
+from portal.constants import BOOKING_DISPLAY_COLUMNS, TICKET_DISPLAY_COLUMNS, TICKET_SLA_HOURS
+from storage import (
+    BOOKING_SCHEMA,
+    TICKET_SCHEMA,
+    MemoryBackend,
+    OlderThan,
+    Range,
+    SheetStore,
+    SQLiteStore,
+    WriteCoordinator,
+)
+
+SHEET_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+QUICK_SHEET_SIZES = [1_000, 10_000, 100_000]
+SQLITE_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+RELOAD_SIZES = [10_000, 100_000, 500_000]
+QUICK_RELOAD_SIZES = [10_000, 100_000]
+EMPLOYEE = "E000007"
+
+
+def sheet_store(schema, rows):
+    # A warm store over the in-memory backend, as the app holds it after the first page view
+    backend = MemoryBackend({schema.name: rows})
+    store = SheetStore(backend, schema, writer=WriteCoordinator(backend), max_staleness=10 ** 9)
+    store.cache.rows()
+    return store
+
+
+def sqlite_store(schema, rows, name):
+    store = SQLiteStore(scratch(f"{name}-{len(rows)}.db"), schema)
+    store.import_frame(pd.DataFrame(rows, columns=schema.columns))
+    return store
+
+
+def ticket_history(store):
+    # The store calls view_my_support_requests makes for one employee with a status filter
+    summary = store.summary(EMPLOYEE)
+    store.count(EMPLOYEE, {"Status": "Open", "Raised At": [OlderThan("Priority", TICKET_SLA_HOURS)]})
+    filters = {"Status": "Open", "Priority": "High"}
+    store.count(EMPLOYEE, filters)
+    store.page(EMPLOYEE, filters, 0, 10, columns=TICKET_DISPLAY_COLUMNS)
+    return summary
+
+
+def booking_history(store):
+    store.summary(EMPLOYEE)
+    store.page(EMPLOYEE, {"Status": "Pending"}, 0, 10, columns=BOOKING_DISPLAY_COLUMNS)
+
+
+@benchmark("submit.ticket.append", SHEET_SIZES, QUICK_SHEET_SIZES)
+def ticket_append(size):
+    # What the submission queue does for log_ticket_to_gsheet: one row through the writer
+    store, number = sheet_store(TICKET_SCHEMA, ticket_rows(size)), count(1)
+    return lambda: store.append(pd.DataFrame([new_ticket(next(number))]))
+
+
+@benchmark("submit.booking.append", SHEET_SIZES, QUICK_SHEET_SIZES)
+def booking_append(size):
+    store, number = sheet_store(BOOKING_SCHEMA, booking_rows(size)), count(1)
+    return lambda: store.append(pd.DataFrame([new_booking(next(number))]))
+
+
+@benchmark("view.tickets.history", SHEET_SIZES, QUICK_SHEET_SIZES)
+def tickets_history(size):
+    store = sheet_store(TICKET_SCHEMA, ticket_rows(size))
+    return lambda: ticket_history(store)
+
+
+@benchmark("view.bookings.history", SHEET_SIZES, QUICK_SHEET_SIZES)
+def bookings_history(size):
+    store = sheet_store(BOOKING_SCHEMA, booking_rows(size))
+    return lambda: booking_history(store)
+
+
+@benchmark("view.tickets.admin_week", SHEET_SIZES, QUICK_SHEET_SIZES)
+def tickets_admin_week(size):
+    # Admin console: open tickets raised in one week, across all employees
+    store = sheet_store(TICKET_SCHEMA, ticket_rows(size))
+    week = {"Status": "Open", "Raised At": [Range(datetime(2023, 6, 1), datetime(2023, 6, 1) + timedelta(days=7))]}
+    return lambda: store.select(week)
+
+
+@benchmark("cache.tickets.reload", RELOAD_SIZES, QUICK_RELOAD_SIZES)
+def tickets_reload(size):
+    # One refresh of the shared copy: the sheet read, then the rows and every index
+    store = sheet_store(TICKET_SCHEMA, ticket_rows(size))
+    return store.cache.reload
+
+
+@benchmark("view.tickets.history_during_reload", RELOAD_SIZES, QUICK_RELOAD_SIZES)
+def tickets_history_during_reload(size):
+    # History views while new snapshots are built back to back in the background.
+    # One timing is size // 500 views, about as long as a reload, so each covers
+    # one and any time readers spend waiting on it shows in every sample rather
+    # than in the odd outlier. The sheet read is replayed from memory so the
+    # reloads spend their time building rows and indexes
+    store = sheet_store(TICKET_SCHEMA, ticket_rows(size))
+    loaded = store.cache.load()
+    store.cache.load = lambda: loaded
+    stop, reloaded = threading.Event(), threading.Event()
+
+    def reload():
+        while not stop.is_set():
+            store.cache.reload()
+            reloaded.set()
+
+    def views():
+        for _ in range(size // 500):
+            ticket_history(store)
+
+    thread = threading.Thread(target=reload, name="bench-reload")
+    thread.start()
+    # Timed from the second reload on, when they follow each other back to back
+    reloaded.wait()
+    yield views
+    stop.set()
+    thread.join()
+
+
+@benchmark("sqlite.tickets.append", SQLITE_SIZES, QUICK_SHEET_SIZES)
+def sqlite_ticket_append(size):
+    store, number = sqlite_store(TICKET_SCHEMA, ticket_rows(size), "append"), count(1)
+    return lambda: store.append(pd.DataFrame([new_ticket(next(number))]))
+
+
+@benchmark("sqlite.tickets.history", SQLITE_SIZES, QUICK_SHEET_SIZES)
+def sqlite_tickets_history(size):
+    store = sqlite_store(TICKET_SCHEMA, ticket_rows(size), "history")
+    return lambda: ticket_history(store)
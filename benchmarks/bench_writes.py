@@ -0,0 +1,31 @@
+from itertools import count
+
+import pandas as pd
+
+from benchmarks.data import new_ticket, ticket_rows
+from benchmarks.harness import benchmark
+from storage import TICKET_SCHEMA, MemoryBackend, SheetStore, to_sheet_rows
+
+# One ticket submission against a sheet that already holds size rows: the
+# append-only write path versus the read-concat-rewrite it replaced
+WRITE_SIZES = [10_000, 100_000, 1_000_000]
+QUICK_WRITE_SIZES = [10_000, 100_000]
+
+
+def rewrite_ticket(backend, record):
+    # The old log_ticket_to_gsheet: conn.read, pd.concat, conn.update of the whole frame
+    existing = backend.read(TICKET_SCHEMA.name, TICKET_SCHEMA.columns, ttl=5)
+    updated = pd.concat([existing, pd.DataFrame([record])], ignore_index=True)
+    backend.sheets[TICKET_SCHEMA.name] = to_sheet_rows(updated, TICKET_SCHEMA.columns)
+
+
+@benchmark("write.ticket.append", WRITE_SIZES, QUICK_WRITE_SIZES)
+def append_ticket(size):
+    store, number = SheetStore(MemoryBackend({TICKET_SCHEMA.name: ticket_rows(size)}), TICKET_SCHEMA), count(1)
+    return lambda: store.append(pd.DataFrame([new_ticket(next(number))]))
+
+
+@benchmark("write.ticket.rewrite", WRITE_SIZES, QUICK_WRITE_SIZES)
+def rewrite(size):
+    backend, number = MemoryBackend({TICKET_SCHEMA.name: ticket_rows(size)}), count(1)
+    return lambda: rewrite_ticket(backend, new_ticket(next(number)))
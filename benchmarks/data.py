@@ -0,0 +1,100 @@
+import io
+import random
+from datetime import datetime, timedelta
+
+from storage import TICKET_SHEET_COLUMNS, TRAVEL_HOTEL_COLUMNS
+
+# Synthetic worksheets and rosters. Values are drawn from small pools so a
+# million-row sheet stays within a few hundred MB; only the IDs are unique.
+
+WORDS = (
+    "laptop charger printer vpn email password outlook monitor keyboard mouse access "
+    "network slow broken request replace install update reset screen battery license"
+).split()
+# Rarer words, so postings vary in length as they do in real ticket text
+VOCABULARY = WORDS + [f"term{number}" for number in range(5000)]
+CATEGORIES = ["IT", "HR", "Finance", "Admin", "Travel"]
+PRIORITIES = ["Low", "Medium", "High", "Critical"]
+START = datetime(2023, 1, 1)
+
+
+def employee_codes(count):
+    return [f"E{number:06d}" for number in range(count)]
+
+
+def sentences(rng, count, length, words=WORDS):
+    return [" ".join(rng.choice(words) for _ in range(length)) for _ in range(count)]
+
+
+def timestamps(rng, count):
+    # (date, time) pairs in DD-MM-YYYY / HH:MM:SS over two years
+    pool = []
+    for _ in range(count):
+        moment = START + timedelta(seconds=rng.randrange(2 * 365 * 86400))
+        pool.append((moment.strftime("%d-%m-%Y"), moment.strftime("%H:%M:%S")))
+    return pool
+
+
+def ticket_rows(count, employees=1000, seed=0):
+    rng = random.Random(seed)
+    codes = employee_codes(employees)
+    subjects = sentences(rng, 500, 4)
+    details = sentences(rng, 5000, 20, VOCABULARY)
+    moments = timestamps(rng, 5000)
+    rows = []
+    for number in range(count):
+        code = codes[number % employees]
+        date, time = moments[number % len(moments)]
+        resolved = number % 3 == 0
+        rows.append([
+            f"TKT-{number:010d}", f"Employee {code}", code, "Engineer", f"{code}@example.com", "9999999999",
+            CATEGORIES[number % len(CATEGORIES)], subjects[number % len(subjects)], details[number % len(details)],
+            "Resolved" if resolved else "Open", date, time, "Done" if resolved else "",
+            date if resolved else "", PRIORITIES[number % len(PRIORITIES)],
+        ])
+    assert len(rows[0]) == len(TICKET_SHEET_COLUMNS)
+    return rows
+
+
+def booking_rows(count, employees=1000, seed=0):
+    rng = random.Random(seed)
+    codes = employee_codes(employees)
+    moments = timestamps(rng, 5000)
+    rows = []
+    for number in range(count):
+        code = codes[number % employees]
+        date, time = moments[number % len(moments)]
+        rows.append([
+            f"REQ-{number:010d}", "Travel", f"Employee {code}", code, "Engineer", f"{code}@example.com",
+            "9999999999", "123412341234", "", "", "", "Train", "Pune", "Mumbai", date, "", "Pending", date, time,
+        ])
+    assert len(rows[0]) == len(TRAVEL_HOTEL_COLUMNS)
+    return rows
+
+
+def new_ticket(number, employee_code="E000000"):
+    # A fresh submission, as log_ticket_to_gsheet receives it
+    row = NEW_TICKET[:]
+    row[0], row[2] = f"TKT-9{number:09d}", employee_code
+    return dict(zip(TICKET_SHEET_COLUMNS, row))
+
+
+def new_booking(number, employee_code="E000000"):
+    row = NEW_BOOKING[:]
+    row[0], row[3] = f"REQ-9{number:09d}", employee_code
+    return dict(zip(TRAVEL_HOTEL_COLUMNS, row))
+
+
+def roster_csv(count, duplicate_every=50):
+    # 'Invoice - Person.csv' layout; every duplicate_every-th name is shared with the previous employee
+    lines = io.StringIO()
+    lines.write("Employee Name,Employee Code,Designation,Department\n")
+    for number, code in enumerate(employee_codes(count)):
+        name_number = number - 1 if duplicate_every and number % duplicate_every == 1 else number
+        lines.write(f"Employee {name_number},{code},Engineer,IT\n")
+    lines.seek(0)
+    return lines
+
+
+NEW_TICKET = ticket_rows(1)[0]
+NEW_BOOKING = booking_rows(1)[0]
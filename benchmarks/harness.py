@@ -0,0 +1,126 @@
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BENCHMARKS = {}
+SCRATCH = tempfile.TemporaryDirectory(prefix="portal-bench-")
+
+
+def benchmark(name, sizes, quick_sizes=None):
+    """Registers func(size) -> callable; only the returned callable is timed, setup is not.
+
+    func may instead be a generator that yields the callable, then cleans up
+    once it has been timed.
+    """
+    def register(func):
+        BENCHMARKS[name] = (func, list(sizes), list(quick_sizes or sizes))
+        return func
+    return register
+
+
+def scratch(name):
+    # Path for a benchmark's files, removed when the run ends
+    return os.path.join(SCRATCH.name, name)
+
+
+def measure(func, min_time=0.2, max_time=10.0, min_runs=3):
+    # Median seconds per call. Calls under a millisecond are timed in loops, as
+    # timeit does, so timer resolution does not distort the scaling curves; the
+    # first sample is a warm-up once there are enough of them
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= 0.001 or number >= 100_000:
+            break
+        number *= 10
+    samples = [elapsed / number]
+    started = time.perf_counter()
+    while len(samples) < min_runs or time.perf_counter() - started < min_time:
+        call_started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - call_started) / number)
+        if time.perf_counter() - started > max_time:
+            break
+    return statistics.median(samples[1:] if len(samples) > 3 else samples)
+
+
+def run(names=None, quick=False, report=print):
+    results = {}
+    for name, (func, sizes, quick_sizes) in BENCHMARKS.items():
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+        results[name] = {}
+        for size in quick_sizes if quick else sizes:
+            setup = func(size)
+            call = next(setup) if inspect.isgenerator(setup) else setup
+            seconds = measure(call)
+            if inspect.isgenerator(setup):
+                next(setup, None)
+            del call, setup
+            gc.collect()
+            results[name][str(size)] = seconds
+            report(f"{name:<40} {size:>9,} {seconds * 1000:>12.4f} ms")
+    return results
+
+
+def save(results, path):
+    document = {
+        "python": sys.version.split()[0],
+        "machine": platform.platform(),
+        "created": time.strftime("%Y-%m-%d"),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def curve(timings, sizes):
+    # Time at each size relative to the smallest size, i.e. the scaling curve
+    first = timings[sizes[0]]
+    return {size: timings[size] / first if first else 0.0 for size in sizes}
+
+
+def compare(results, baseline, tolerance=2.0, max_slowdown=None):
+    """Regressions against the baseline as (benchmark, size, reason) tuples.
+
+    A benchmark is flagged when its time at any size, relative to its time at
+    the smallest size both runs measured, grew more than tolerance times the
+    baseline's ratio: the scaling got worse regardless of how fast the machine
+    is. Absolute slowdowns are flagged only when max_slowdown is given.
+    """
+    regressions = []
+    for name, timings in sorted(results.items()):
+        if name not in baseline:
+            continue
+        sizes = sorted(set(timings) & set(baseline[name]), key=int)
+        if not sizes:
+            continue
+        current, expected = curve(timings, sizes), curve(baseline[name], sizes)
+        for size in sizes[1:]:
+            if expected[size] and current[size] > expected[size] * tolerance:
+                regressions.append((
+                    name, size,
+                    f"grows {current[size]:.1f}x from size {sizes[0]} (baseline {expected[size]:.1f}x)",
+                ))
+        if max_slowdown:
+            for size in sizes:
+                slowdown = timings[size] / baseline[name][size] if baseline[name][size] else 0.0
+                if slowdown > max_slowdown:
+                    regressions.append((name, size, f"{slowdown:.1f}x slower than baseline"))
+    return regressions
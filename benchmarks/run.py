@@ -0,0 +1,54 @@
+import argparse
+import logging
+import os
+import sys
+
+from benchmarks import bench_directory, bench_search, bench_storage, bench_writes  # noqa: F401 (registers the benchmarks)
+from benchmarks.harness import compare, load, run, save
+
+# Times the stores, views, search and login across synthetic sheets of 1k-1M rows and
+# compares the scaling curves with the committed baseline.
+#
+#   python -m benchmarks.run                     full sizes, compare with baseline.json
+#   python -m benchmarks.run --quick             sizes up to 100k, for a quick check
+#   python -m benchmarks.run --save              record a new baseline.json
+#   python -m benchmarks.run view. submit.       only benchmarks with these prefixes
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("names", nargs="*", help="only run benchmarks whose name starts with one of these")
+    parser.add_argument("--quick", action="store_true", help="skip the largest sizes")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=2.0,
+                        help="flag a benchmark whose growth from the smallest size is this many times the baseline's")
+    parser.add_argument("--max-slowdown", type=float, default=None,
+                        help="also flag absolute times this many times slower than the baseline")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    results = run(args.names, quick=args.quick)
+    if args.save:
+        if os.path.exists(args.baseline) and args.names:
+            # Keep the benchmarks that were not re-run
+            results = {**load(args.baseline), **results}
+        save(results, args.baseline)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save to create one")
+        return 0
+
+    regressions = compare(results, load(args.baseline), args.tolerance, args.max_slowdown)
+    for name, size, reason in regressions:
+        print(f"REGRESSION {name} at {int(size):,}: {reason}")
+    if not regressions:
+        print("No regressions against the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
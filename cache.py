@@ -0,0 +1,294 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a failed background refresh is tried again
+RETRY_INTERVAL = 5
+
+
+class KeyIndex:
+    """Groups the cached rows by the value in one column."""
+
+    def __init__(self, position):
+        self.position = position
+        self.groups = defaultdict(list)
+
+    def empty(self):
+        return KeyIndex(self.position)
+
+    def rebuild(self, rows):
+        groups = defaultdict(list)
+        for row in rows:
+            groups[row[self.position]].append(row)
+        self.groups = groups
+
+    def add(self, rows):
+        for row in rows:
+            self.groups[row[self.position]].append(row)
+
+    def replace(self, old_row, new_row):
+        # new_row is the cached row itself, updated in place
+        old_key, new_key = old_row[self.position], new_row[self.position]
+        if old_key != new_key:
+            self.groups[old_key] = [row for row in self.groups[old_key] if row is not new_row]
+            self.groups[new_key].append(new_row)
+
+    def get(self, key):
+        return list(self.groups.get(key, ()))
+
+
+class CountIndex:
+    """Per-key counts of the values in a few columns (e.g. tickets per status for each employee)."""
+
+    def __init__(self, key_position, positions):
+        self.key_position = key_position
+        self.positions = positions
+        self.totals = defaultdict(int)
+        self.counts = defaultdict(lambda: {column: defaultdict(int) for column in self.positions})
+
+    def empty(self):
+        return CountIndex(self.key_position, self.positions)
+
+    def rebuild(self, rows):
+        self.totals.clear()
+        self.counts.clear()
+        self.add(rows)
+
+    def add(self, rows):
+        for row in rows:
+            key = row[self.key_position]
+            self.totals[key] += 1
+            counts = self.counts[key]
+            for column, position in self.positions.items():
+                counts[column][row[position]] += 1
+
+    def replace(self, old_row, new_row):
+        old_counts = self.counts[old_row[self.key_position]]
+        new_counts = self.counts[new_row[self.key_position]]
+        self.totals[old_row[self.key_position]] -= 1
+        self.totals[new_row[self.key_position]] += 1
+        for column, position in self.positions.items():
+            old_counts[column][old_row[position]] -= 1
+            if not old_counts[column][old_row[position]]:
+                del old_counts[column][old_row[position]]
+            new_counts[column][new_row[position]] += 1
+
+    def get(self, key):
+        summary = {"Total": self.totals.get(key, 0)}
+        counts = self.counts.get(key, {})
+        for column in self.positions:
+            summary[column] = dict(counts.get(column, {}))
+        return summary
+
+
+class Snapshot:
+    """One load of the worksheet: its rows, their lookups by key and its own copy of each index."""
+
+    def __init__(self, rows, row_numbers, key_position, indexes, loaded_at):
+        self.rows = rows
+        self.by_key = {row[key_position]: row for row in rows}
+        self.row_numbers = {row[key_position]: number for row, number in zip(rows, row_numbers)}
+        self.loaded_at = loaded_at
+        self.indexes = {}
+        for index in indexes:
+            self.build(index)
+
+    def build(self, index):
+        built = index.empty()
+        built.rebuild(self.rows)
+        self.indexes[index] = built
+
+
+class SheetCache:
+    """Process-wide copy of one worksheet, shared by every session on the server.
+
+    Only the first read waits for the sheet, and concurrent first readers share
+    that one load. Once the copy is older than max_staleness, the next read
+    starts a single background refresh and keeps being served the stale copy;
+    the new snapshot, rows and indexes alike, is built off the lock and
+    published by swapping one reference. The app's own appends and edits are
+    patched in place, and replayed onto a snapshot whose load they overlapped,
+    so a user sees their submission immediately.
+
+    add_index registers an index that follows the empty/rebuild/add/replace
+    protocol; each snapshot builds its own copy, reached through lookup and
+    query with the registered index as the handle.
+    """
+
+    def __init__(self, load, key_position, max_staleness=60):
+        self.load = load
+        self.key_position = key_position
+        self.max_staleness = max_staleness
+        self.hits = 0
+        self.misses = 0
+        self._snapshot = None
+        self._indexes = []
+        # Writes made while a load is running, replayed onto the snapshot it publishes
+        self._writes = None
+        self._refreshing = False
+        self._refresh_after = 0.0
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+
+    def add_index(self, index):
+        with self._lock:
+            self._indexes.append(index)
+            if self._snapshot is not None:
+                self._snapshot.build(index)
+        return index
+
+    def reload(self):
+        """Loads the sheet in the calling thread; other readers keep the current copy meanwhile."""
+        with self._load_lock:
+            self._reload()
+
+    def _reload(self):
+        with self._lock:
+            self._writes = []
+            indexes = list(self._indexes)
+        try:
+            loaded_at = time.monotonic()
+            rows, row_numbers = self.load()
+            snapshot = Snapshot(rows, row_numbers, self.key_position, indexes, loaded_at)
+        except Exception:
+            with self._lock:
+                self._writes = None
+            raise
+        with self._lock:
+            writes, self._writes = self._writes, None
+            for index in self._indexes[len(indexes):]:
+                snapshot.build(index)
+            self._snapshot = snapshot
+            self._refresh_after = loaded_at + self.max_staleness
+            for write, args in writes:
+                write(*args)
+
+    def _refresh(self):
+        try:
+            self.reload()
+        except Exception as e:
+            self._refresh_after = time.monotonic() + RETRY_INTERVAL
+            logger.warning("Could not refresh the sheet copy, serving the stale one: %s", e)
+        finally:
+            self._refreshing = False
+
+    def _ensure_loaded(self):
+        # Called without the lock held, so a load never blocks readers or writes
+        if self._snapshot is None:
+            with self._load_lock:
+                if self._snapshot is None:
+                    self.misses += 1
+                    self._reload()
+                    return
+        self.hits += 1
+        if time.monotonic() >= self._refresh_after:
+            with self._lock:
+                if self._refreshing:
+                    return
+                self._refreshing = True
+            threading.Thread(target=self._refresh, name="sheet-cache-refresh", daemon=True).start()
+
+    def rows(self):
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._snapshot.rows)
+
+    def lookup(self, index, key):
+        return self.query(index, lambda built: built.get(key))
+
+    def query(self, index, func):
+        # Runs func on the current snapshot's copy of a registered index
+        self._ensure_loaded()
+        with self._lock:
+            return func(self._snapshot.indexes[index])
+
+    def call(self, func, *args, **kwargs):
+        # Runs func(rows, ...) on the current copy's rows while holding the cache lock;
+        # func should copy out only what it needs and not keep the list
+        self._ensure_loaded()
+        with self._lock:
+            return func(self._snapshot.rows, *args, **kwargs)
+
+    def append(self, rows, first_row=None):
+        with self._lock:
+            if self._writes is not None:
+                self._writes.append((self._append, (rows, first_row)))
+            self._append(rows, first_row)
+
+    def _append(self, rows, first_row):
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        if first_row is not None:
+            for offset, row in enumerate(rows):
+                snapshot.row_numbers.setdefault(row[self.key_position], first_row + offset)
+        # The load may already contain these rows
+        rows = [row for row in rows if row[self.key_position] not in snapshot.by_key]
+        snapshot.rows.extend(rows)
+        for row in rows:
+            snapshot.by_key[row[self.key_position]] = row
+        for index in snapshot.indexes.values():
+            index.add(rows)
+
+    def peek(self, key):
+        # Row for key if the copy is loaded and fresh; never triggers a load
+        with self._lock:
+            if self._snapshot is None or time.monotonic() - self._snapshot.loaded_at > self.max_staleness:
+                return None
+            row = self._snapshot.by_key.get(key)
+            if row is not None:
+                self.hits += 1
+            return row
+
+    def find(self, keys):
+        # Rows for the keys present in the current copy, in the order given
+        self._ensure_loaded()
+        with self._lock:
+            by_key = self._snapshot.by_key
+            return [by_key[key] for key in keys if key in by_key]
+
+    def keys_present(self, keys):
+        self._ensure_loaded()
+        with self._lock:
+            return {key for key in keys if key in self._snapshot.by_key}
+
+    def locate(self, keys):
+        # Sheet row number for each key, None where it is not known
+        self._ensure_loaded()
+        with self._lock:
+            return {key: self._snapshot.row_numbers.get(key) for key in keys}
+
+    def update(self, changes, refresh=None):
+        # changes: key -> {column position: new value}; refresh(row) recomputes derived cells
+        with self._lock:
+            if self._writes is not None:
+                self._writes.append((self._update, (changes, refresh)))
+            self._update(changes, refresh)
+
+    def _update(self, changes, refresh):
+        if self._snapshot is None:
+            return
+        for key, values in changes.items():
+            row = self._snapshot.by_key.get(key)
+            if row is None:
+                continue
+            old_row = list(row)
+            for position, value in values.items():
+                row[position] = value
+            if refresh is not None:
+                refresh(row)
+            for index in self._snapshot.indexes.values():
+                index.replace(old_row, row)
+
+    def stats(self):
+        with self._lock:
+            snapshot = self._snapshot
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "rows": len(snapshot.rows) if snapshot else 0,
+                "age_seconds": time.monotonic() - snapshot.loaded_at if snapshot else None,
+            }
@@ -0,0 +1,143 @@
+import io
+import multiprocessing
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from fpdf import FPDF
+
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logo.png")
+
+# kind -> (title, ID column, one-line fields, free-text field)
+DOCUMENTS = {
+    "ticket": (
+        "Support Ticket Confirmation",
+        "Ticket ID",
+        [
+            "Ticket ID",
+            "Raised By (Employee Name)",
+            "Raised By (Employee Code)",
+            "Raised By (Designation)",
+            "Raised By (Email)",
+            "Raised By (Phone)",
+            "Category",
+            "Priority",
+            "Subject",
+            "Status",
+            "Date Raised",
+            "Time Raised",
+        ],
+        "Details",
+    ),
+    "booking": (
+        "Travel & Hotel Booking Voucher",
+        "Request ID",
+        [
+            "Request ID",
+            "Request Type",
+            "Employee Name",
+            "Employee Code",
+            "Designation",
+            "Email",
+            "Phone",
+            "Hotel Name",
+            "Check In Date",
+            "Check Out Date",
+            "Travel Mode",
+            "From Location",
+            "To Location",
+            "Booking Date",
+            "Status",
+            "Date Requested",
+        ],
+        "Remarks",
+    ),
+}
+
+# Layout in mm on an A4 page
+LABEL_X = 15
+VALUE_X = 75
+FIRST_ROW_Y = 50
+ROW_HEIGHT = 8
+NOTES_MAX_CHARS = 1500
+
+# A document takes well under a millisecond to draw, so starting worker
+# processes only pays off for large batches on a multi-core machine
+POOL_MIN_DOCUMENTS = 500
+
+
+def text(value):
+    # The core PDF fonts are Latin-1 only
+    if value is None or value != value or value == "":
+        return "-"
+    return str(value).encode("latin-1", "replace").decode("latin-1")
+
+
+def pdf_bytes(pdf):
+    data = pdf.output(dest="S")
+    return data.encode("latin-1") if isinstance(data, str) else bytes(data)
+
+
+def notes_y(fields):
+    return FIRST_ROW_Y + len(fields) * ROW_HEIGHT + 4
+
+
+def draw_static(pdf, kind):
+    # Logo, title, field labels and footer: the same on every document
+    title, _, fields, notes = DOCUMENTS[kind]
+    pdf.image(LOGO_PATH, x=LABEL_X, y=10, w=60)
+    pdf.set_font("Arial", "B", 16)
+    pdf.set_xy(LABEL_X, 34)
+    pdf.cell(0, 10, title)
+    pdf.line(LABEL_X, 46, 195, 46)
+
+    pdf.set_font("Arial", "B", 10)
+    for number, field in enumerate(fields):
+        pdf.set_xy(LABEL_X, FIRST_ROW_Y + number * ROW_HEIGHT)
+        pdf.cell(VALUE_X - LABEL_X, ROW_HEIGHT, f"{field}:")
+    pdf.set_xy(LABEL_X, notes_y(fields))
+    pdf.cell(0, ROW_HEIGHT, f"{notes}:")
+
+    pdf.line(LABEL_X, 280, 195, 280)
+    pdf.set_font("Arial", "I", 8)
+    pdf.set_xy(LABEL_X, 282)
+    pdf.cell(0, 5, "This is a system-generated document and does not require a signature.")
+
+
+def render(kind, record):
+    """PDF bytes for one ticket or booking record (a dict of sheet columns)."""
+    _, _, fields, notes = DOCUMENTS[kind]
+    pdf = FPDF(format="A4")
+    pdf.set_auto_page_break(False)
+    pdf.add_page()
+    draw_static(pdf, kind)
+    pdf.set_font("Arial", "", 10)
+    for number, field in enumerate(fields):
+        pdf.set_xy(VALUE_X, FIRST_ROW_Y + number * ROW_HEIGHT)
+        pdf.cell(195 - VALUE_X, ROW_HEIGHT, text(record.get(field)))
+    pdf.set_xy(LABEL_X, notes_y(fields) + ROW_HEIGHT)
+    pdf.multi_cell(180, 5, text(record.get(notes))[:NOTES_MAX_CHARS])
+    return pdf_bytes(pdf)
+
+
+def render_batch(kind, records, processes=None):
+    """Renders one PDF per record and returns them as a ZIP archive named by ID.
+
+    Larger batches are spread over a pool of worker processes. Workers are
+    spawned rather than forked because the app server is multi-threaded.
+    """
+    id_column = DOCUMENTS[kind][1]
+    if len(records) < POOL_MIN_DOCUMENTS or (os.cpu_count() or 1) < 2:
+        documents = [render(kind, record) for record in records]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(processes, mp_context=context) as pool:
+            documents = list(pool.map(render, repeat(kind), records, chunksize=16))
+
+    archive = io.BytesIO()
+    # PDF streams are already compressed
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+        for record, document in zip(records, documents):
+            zf.writestr(f"{record[id_column]}.pdf", document)
+    return archive.getvalue()
@@ -0,0 +1,151 @@
+import csv
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+
+class Employee:
+    __slots__ = ("name", "code", "designation", "department")
+
+    def __init__(self, name, code, designation, department):
+        self.name = name
+        self.code = code
+        self.designation = designation
+        self.department = department
+
+
+class EmployeeDirectory:
+    """Roster lookups by name and by employee code, built once from 'Invoice - Person.csv'.
+
+    Names are not unique in the roster, so a name maps to every employee carrying
+    it and the passkey (the employee code) decides which one is logging in.
+    """
+
+    def __init__(self, employees):
+        self.by_name = {}
+        self.by_code = {}
+        for employee in employees:
+            self.by_name.setdefault(employee.name, []).append(employee)
+            if not employee.code:
+                continue
+            if employee.code in self.by_code:
+                logger.warning("Duplicate employee code %s in roster, keeping the first entry", employee.code)
+                continue
+            self.by_code[employee.code] = employee
+        self.by_name = {name: tuple(matches) for name, matches in self.by_name.items()}
+        self.names = list(self.by_name)
+
+    @classmethod
+    def parse(cls, lines):
+        # Short (ragged) rows leave the missing fields as None
+        employees = []
+        reader = csv.DictReader(lines)
+        for row in reader:
+            name, code, designation, department = (
+                (row.get(column) or "").strip()
+                for column in ("Employee Name", "Employee Code", "Designation", "Department")
+            )
+            if not name:
+                continue
+            if not code:
+                logger.warning("Skipping %s on roster line %d: no employee code", name, reader.line_num)
+                continue
+            employees.append(Employee(name, code, designation, department))
+        return cls(employees)
+
+    @classmethod
+    def from_csv(cls, path):
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls.parse(f)
+
+    def __len__(self):
+        return len(self.by_code)
+
+    def get(self, employee_code):
+        return self.by_code.get(str(employee_code))
+
+    def authenticate(self, employee_name, passkey):
+        passkey = str(passkey).strip()
+        for employee in self.by_name.get(employee_name, ()):
+            if employee.code and employee.code == passkey:
+                return employee
+        return None
+
+
+class RosterLoader:
+    """Holds the current EmployeeDirectory and swaps in a new one when the CSV changes.
+
+    get() only stats the file (at most every check_interval seconds); a change is
+    parsed on a background thread and published by replacing the reference, so
+    sessions keep using the previous snapshot until the new one is ready.
+    """
+
+    def __init__(self, path, check_interval=5):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._reloading = False
+        self._signature = self._stat()
+        self._digest, self._directory = self._load()
+        self._checked_at = time.monotonic()
+
+    def _stat(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self):
+        started = time.perf_counter()
+        with METRICS.timer("roster.load") as payload:
+            with open(self.path, "rb") as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            directory = EmployeeDirectory.parse(io.StringIO(content.decode("utf-8"), newline=""))
+            payload["rows"], payload["bytes"] = len(directory), len(content)
+        logger.info(
+            "Loaded roster %s: %d rows, %d employees with codes in %.1f ms",
+            self.path, sum(len(matches) for matches in directory.by_name.values()),
+            len(directory), (time.perf_counter() - started) * 1000,
+        )
+        return digest, directory
+
+    def get(self):
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            self._check_for_changes()
+        return self._directory
+
+    def _check_for_changes(self):
+        try:
+            signature = self._stat()
+        except OSError as e:
+            logger.warning("Cannot stat roster %s, keeping the loaded copy: %s", self.path, e)
+            return
+        if signature == self._signature:
+            return
+        with self._lock:
+            if self._reloading:
+                return
+            self._reloading = True
+        threading.Thread(target=self._reload, args=(signature,), name="roster-reload", daemon=True).start()
+
+    def _reload(self, signature):
+        try:
+            digest, directory = self._load()
+            if digest == self._digest:
+                logger.info("Roster %s touched but content unchanged", self.path)
+            else:
+                self._digest, self._directory = digest, directory
+            self._signature = signature
+        except Exception:
+            logger.exception("Reloading roster %s failed, keeping the previous copy", self.path)
+        finally:
+            with self._lock:
+                self._reloading = False
@@ -0,0 +1,89 @@
+import csv
+import io
+
+import pandas as pd
+
+EXPORT_CHUNK_ROWS = 5000
+
+# Label -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+
+def cell(value):
+    if value is None or value is pd.NaT or (isinstance(value, float) and pd.isna(value)):
+        return None
+    return value.to_pydatetime() if isinstance(value, pd.Timestamp) else value
+
+
+def write_csv(chunks, f):
+    writer = None
+    for chunk in chunks:
+        if writer is None:
+            writer = csv.writer(f)
+            writer.writerow(chunk.columns)
+        writer.writerows([cell(value) for value in row] for row in chunk.itertuples(index=False, name=None))
+
+
+def write_xlsx(chunks, f):
+    # write_only keeps just the current row in memory instead of the whole sheet
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Export")
+    header = False
+    for chunk in chunks:
+        if not header:
+            sheet.append(list(chunk.columns))
+            header = True
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append([cell(value) for value in row])
+    workbook.save(f)
+
+
+def write_parquet(chunks, f):
+    # One row group per chunk; every chunk is written with the first chunk's column types
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                schema = pa.schema([
+                    (column, pa.timestamp("s") if pd.api.types.is_datetime64_any_dtype(dtype) else pa.string())
+                    for column, dtype in chunk.dtypes.items()
+                ])
+                writer = pq.ParquetWriter(f, schema)
+            chunk = chunk.astype({
+                column: object for column, dtype in chunk.dtypes.items()
+                if not pd.api.types.is_datetime64_any_dtype(dtype)
+            })
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+WRITERS = {"CSV": write_csv, "Excel": write_xlsx, "Parquet": write_parquet}
+
+
+def export_bytes(chunks, export_format):
+    """Returns the chunks written in the given format.
+
+    The whole file ends up in memory: st.download_button needs its contents as
+    one bytes object to serve it. Writing chunk by chunk only keeps the DataFrames
+    from piling up next to it.
+    """
+    buffer = io.BytesIO()
+    if export_format == "CSV":
+        text = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+        write_csv(chunks, text)
+        text.flush()
+        text.detach()
+    else:
+        WRITERS[export_format](chunks, buffer)
+    return buffer.getvalue()
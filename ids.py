@@ -0,0 +1,52 @@
+import secrets
+import threading
+from datetime import datetime
+
+# Crockford base32: no I, L, O or U, so IDs read back unambiguously
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def encode_base32(value, length):
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 32)
+        chars.append(ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+class IdGenerator:
+    """ULID-style IDs such as TKT-20250430-0K3M9Z7F2Q8C4R1X.
+
+    After the prefix and date come the milliseconds since midnight (6 chars) and
+    50 random bits (10 chars), so IDs sort by creation time and sit next to each
+    other in the store's key index. Within a process each ID is strictly greater
+    than the previous one (the random part is incremented inside the same
+    millisecond); across processes the random bits keep them apart.
+    """
+
+    RANDOM_BITS = 50
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._last = ("", -1, 0)
+
+    def __call__(self):
+        now = datetime.now()
+        day = now.strftime("%Y%m%d")
+        millis = ((now.hour * 60 + now.minute) * 60 + now.second) * 1000 + now.microsecond // 1000
+        with self._lock:
+            last_day, last_millis, last_random = self._last
+            if (day, millis) <= (last_day, last_millis):
+                # Same millisecond, or the clock stepped back: keep counting up
+                day, millis, random = last_day, last_millis, last_random + 1
+                if random >> self.RANDOM_BITS:
+                    millis, random = millis + 1, 0
+            else:
+                random = secrets.randbits(self.RANDOM_BITS)
+            self._last = (day, millis, random)
+        return f"{self.prefix}-{day}-{encode_base32(millis, 6)}{encode_base32(random, 10)}"
+
+
+generate_ticket_id = IdGenerator("TKT")
+generate_request_id = IdGenerator("REQ")
@@ -0,0 +1,281 @@
+import fcntl
+import glob
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_PATH = "submissions.journal"
+STORE, MIRROR = "store", "mirror"
+
+
+class SubmissionJournal:
+    """Append-only JSON-lines file of submissions that have not reached the store yet.
+
+    Each submission is written (and fsynced) as a "submit" line before anything
+    talks to the network; a later "ack" line marks it as stored. An entry can
+    have more than one target (the store and its mirror), each acknowledged
+    separately, and stays pending until all of them are. Unacknowledged entries
+    survive a restart and are picked up again on load.
+
+    Every server process owns one journal file under an exclusive lock: path
+    itself, or path.1, path.2, ... when other processes hold the earlier ones.
+    Journals left by processes that are no longer running are adopted on start,
+    so each entry is replayed by exactly one process.
+    """
+
+    def __init__(self, path, compact_after=1000):
+        self.base_path = path
+        self.compact_after = compact_after
+        self._lock = threading.Lock()
+        self.path, self._lock_file = self._claim()
+        self._pending, self._lines = self._read(self.path)
+        self._adopt_orphans()
+        if self._pending:
+            logger.info("%d unsynced submissions found in %s", len(self._pending), self.path)
+
+    def _claim(self):
+        slot = 0
+        while True:
+            path = self.base_path if slot == 0 else f"{self.base_path}.{slot}"
+            lock_file = try_lock(path)
+            if lock_file is not None:
+                return path, lock_file
+            slot += 1
+
+    def _adopt_orphans(self):
+        pattern = re.compile(re.escape(self.base_path) + r"(\.\d+)?$")
+        for path in sorted(glob.glob(glob.escape(self.base_path) + "*")):
+            if path == self.path or not pattern.match(path):
+                continue
+            lock_file = try_lock(path)
+            if lock_file is None:
+                continue
+            try:
+                pending, _ = self._read(path)
+                adopted = [entry for entry_id, entry in pending.items() if entry_id not in self._pending]
+                for entry in adopted:
+                    self._write(entry)
+                    self._pending[entry["entry"]] = entry
+                os.remove(path)
+                if adopted:
+                    logger.info("Adopted %d unsynced submissions from %s", len(adopted), path)
+            finally:
+                lock_file.close()
+
+    def _read(self, path):
+        pending, lines = {}, 0
+        if not os.path.exists(path):
+            return pending, lines
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A crash mid-write can leave a torn last line
+                    logger.warning("Skipping unreadable line in %s", path)
+                    continue
+                if entry["op"] == "submit":
+                    entry.setdefault("targets", [STORE])
+                    pending[entry["entry"]] = entry
+                elif entry["op"] == "ack":
+                    for entry_id in entry["entries"]:
+                        remove_target(pending, entry_id, entry.get("target"))
+        return pending, lines
+
+    def _write(self, entry):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._lines += 1
+
+    def _compact(self):
+        # Rewrites the file with just the pending submissions; the rename is atomic,
+        # so a crash leaves either the old or the new file
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            for entry in self._pending.values():
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+        self._lines = len(self._pending)
+
+    def add(self, table, records, targets=(STORE,)):
+        return self._add({"table": table, "records": records}, targets)
+
+    def add_updates(self, table, updates, targets=(MIRROR,)):
+        # updates: key -> {column: value}, replayed with update_many
+        return self._add({"table": table, "updates": updates}, targets)
+
+    def _add(self, fields, targets):
+        entry = {"op": "submit", "entry": uuid.uuid4().hex, **fields, "targets": list(targets), "queued_at": time.time()}
+        with self._lock:
+            self._write(entry)
+            self._pending[entry["entry"]] = entry
+        return entry["entry"]
+
+    def ack(self, entry_ids, target=STORE):
+        with self._lock:
+            for entry_id in entry_ids:
+                remove_target(self._pending, entry_id, target)
+            if not self._pending or self._lines >= self.compact_after:
+                self._compact()
+            else:
+                self._write({"op": "ack", "entries": list(entry_ids), "target": target})
+
+    def close(self):
+        # Releases the file for another process to adopt
+        self._lock_file.close()
+
+    def pending(self, table=None, target=None):
+        with self._lock:
+            return [
+                entry
+                for entry in self._pending.values()
+                if (table is None or entry["table"] == table) and (target is None or target in entry["targets"])
+            ]
+
+
+def remove_target(pending, entry_id, target):
+    # An ack without a target (written before entries had several) covers them all
+    entry = pending.get(entry_id)
+    if entry is None:
+        return
+    entry["targets"] = [name for name in entry["targets"] if target is not None and name != target]
+    if not entry["targets"]:
+        del pending[entry_id]
+
+
+def try_lock(path):
+    # The lock lives in a side file so compaction can replace the journal itself
+    lock_file = open(f"{path}.lock", "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+class SubmissionQueue:
+    """Accepts submissions into the journal and drains them to the stores on a background thread.
+
+    Entries for the same table are written in batches of up to batch_size rows;
+    a failed write is retried with exponential backoff capped at max_backoff
+    seconds, skipping any rows whose ID the store already holds.
+
+    Tables in mirrors are also copied to a second store, by their own thread
+    with its own retries, so a slow or failing mirror never holds up the store.
+    The mirror receives appends and edits in the order they were journaled.
+    """
+
+    def __init__(self, journal, stores, mirrors=None, batch_size=200, max_backoff=300):
+        self.journal = journal
+        self.stores = stores
+        self.mirrors = mirrors or {}
+        self.batch_size = batch_size
+        self.max_backoff = max_backoff
+        self.last_error = None
+        self.mirror_error = None
+        self._wake = {STORE: threading.Event(), MIRROR: threading.Event()}
+        # Left by a run that mirrored tables this one does not
+        unmirrored = [entry["entry"] for entry in journal.pending(target=MIRROR) if entry["table"] not in self.mirrors]
+        if unmirrored:
+            journal.ack(unmirrored, MIRROR)
+        self._start(STORE, "submission-sync")
+        if self.mirrors:
+            self._start(MIRROR, "mirror-sync")
+
+    def _start(self, target, name):
+        self._wake[target].set()
+        threading.Thread(target=self._run, args=(target,), name=name, daemon=True).start()
+
+    def _targets(self, table):
+        return [STORE, MIRROR] if table in self.mirrors else [STORE]
+
+    def submit(self, table, records):
+        entry_id = self.journal.add(table, records, self._targets(table))
+        for target in self._targets(table):
+            self._wake[target].set()
+        return entry_id
+
+    def update(self, table, updates):
+        # Applied to the store right away, so errors reach the caller; the
+        # mirror gets the edit after every submission journaled before it
+        self.stores[table].update_many(updates)
+        if table in self.mirrors:
+            self.journal.add_updates(table, updates)
+            self._wake[MIRROR].set()
+
+    def pending_records(self, table, column, value):
+        return [
+            record
+            for entry in self.journal.pending(table, STORE)
+            for record in entry["records"]
+            if str(record.get(column)) == str(value)
+        ]
+
+    def _next_batch(self, table, target):
+        batch, rows = [], 0
+        for entry in self.journal.pending(table, target):
+            if "updates" in entry:
+                # Edits are replayed one entry at a time, in order with the appends
+                return batch or [entry]
+            if batch and rows + len(entry["records"]) > self.batch_size:
+                break
+            batch.append(entry)
+            rows += len(entry["records"])
+        return batch
+
+    def _sync_once(self, target, recovering):
+        stores = self.stores if target == STORE else self.mirrors
+        for table, store in stores.items():
+            key = store.schema.key
+            while True:
+                batch = self._next_batch(table, target)
+                if not batch:
+                    break
+                if "updates" in batch[0]:
+                    store.update_many(batch[0]["updates"])
+                    self.journal.ack([batch[0]["entry"]], target)
+                    continue
+                records = [record for entry in batch for record in entry["records"]]
+                # A previous attempt may have reached the store before failing or
+                # before its ack was written; replaying by ID keeps it idempotent
+                stored = store.existing_keys([record[key] for record in records], refresh=recovering)
+                if stored:
+                    logger.info("Skipping %d %s rows that are already stored", len(stored), table)
+                    records = [record for record in records if record[key] not in stored]
+                if records:
+                    store.append(pd.DataFrame(records))
+                self.journal.ack([entry["entry"] for entry in batch], target)
+
+    def _run(self, target):
+        backoff = 0
+        # The first pass replays whatever a previous run left unacknowledged
+        recovering = True
+        error = "last_error" if target == STORE else "mirror_error"
+        while True:
+            self._wake[target].wait(timeout=backoff or None)
+            self._wake[target].clear()
+            try:
+                self._sync_once(target, recovering)
+            except Exception as e:
+                setattr(self, error, f"{type(e).__name__}: {e}")
+                backoff = min(self.max_backoff, backoff * 2 or 1)
+                recovering = True
+                logger.warning("%s sync failed, retrying in %ss: %s", target.capitalize(), backoff, getattr(self, error))
+            else:
+                setattr(self, error, None)
+                backoff = 0
+                recovering = False
@@ -0,0 +1,254 @@
+import argparse
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from datetime import date, timedelta
+from unittest import mock
+
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.secrets import Secrets
+from streamlit.testing.v1 import AppTest, app_test, local_script_runner
+from streamlit.testing.v1.util import patch_config_options
+
+from directory import EmployeeDirectory
+from storage import BOOKING_SCHEMA, TICKET_SCHEMA
+
+# Drives portal.main through Streamlit's AppTest with N concurrent users against
+# [storage] backend = "memory", then reports per-step latency percentiles,
+# throughput and whether every submitted ticket and request reached its sheet
+# exactly once. Each user logs in, then per iteration raises a ticket, reloads
+# My Support Tickets and submits a travel and a hotel request.
+#
+#   python loadtest.py --users 50 --iterations 3 --latency 0.2 --jitter 0.3
+#
+# The process-wide objects (backend, stores, submission queue) are created by
+# the first run, so one process runs one load test.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(ROOT, "app.py")
+ROSTER_PATH = os.path.join(ROOT, "Invoice - Person.csv")
+STEPS = ["login_page", "login", "ticket_page", "submit_ticket", "my_tickets", "booking_page", "travel_request",
+         "hotel_request"]
+
+
+def percentile(samples, percent):
+    # Nearest rank
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+class User:
+    """One browser session: an AppTest whose reruns are timed per step."""
+
+    def __init__(self, employee, timeout):
+        self.employee = employee
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.timings = defaultdict(list)
+        self.errors = []
+        self.ticket_ids = []
+        self.request_ids = []
+
+    def run(self, step):
+        start = time.perf_counter()
+        try:
+            self.app.run()
+        except Exception as e:
+            self.errors.append(f"{step}: {type(e).__name__}: {e}")
+            return False
+        self.timings[step].append(time.perf_counter() - start)
+        messages = [element.value for element in list(self.app.exception) + list(self.app.error)]
+        self.errors.extend(f"{step}: {message}" for message in messages)
+        return not messages
+
+    def open_page(self, step, page):
+        self.app.sidebar.radio[0].set_value(page)
+        return self.run(step)
+
+    def fill(self, tab, **values):
+        # Widgets in a tab by label, e.g. fill(tab, Subject="...", **{"Your Email*": "..."})
+        widgets = list(tab.text_input) + list(tab.text_area) + list(tab.date_input)
+        for label, value in values.items():
+            next(widget for widget in widgets if widget.label == label).set_value(value)
+
+    def session(self, iterations):
+        try:
+            self.steps(iterations)
+        except Exception as e:
+            self.errors.append(f"{self.employee.name}: {type(e).__name__}: {e}")
+
+    def steps(self, iterations):
+        employee = self.employee
+        contact = {"Your Email*": f"{employee.code.lower()}@example.com", "Your Phone Number*": "9876543210"}
+        self.run("login_page")
+        self.app.selectbox(key="employee_select").set_value(employee.name)
+        self.app.text_input(key="passkey_input").set_value(employee.code)
+        self.app.button(key="login_button").click()
+        if not self.run("login") or not self.app.session_state["authenticated"]:
+            self.errors.append(f"login: {employee.name} could not log in")
+            return
+
+        for iteration in range(iterations):
+            self.open_page("ticket_page", "Raise Support Ticket")
+            tab = self.app.tabs[0]
+            self.fill(tab, **contact, **{"Subject*": f"Load test {iteration}", "Details*": "Laptop charger broken"})
+            tab.button[0].click()
+            if self.run("submit_ticket"):
+                self.ticket_ids.append(self.app.session_state["ticket_confirmation"]["Ticket ID"])
+            # The My Support Requests tab renders on every run of the page
+            self.run("my_tickets")
+
+            self.open_page("booking_page", "Travel & Hotel Booking")
+            tab = self.app.tabs[0]
+            self.fill(tab, **contact, **{"Aadhaar Number*": "123412341234", "From*": "Pune", "To*": "Mumbai"})
+            tab.button[0].click()
+            if self.run("travel_request"):
+                self.request_ids.append(self.app.session_state["booking_confirmation"]["Request ID"])
+
+            tab = self.app.tabs[1]
+            check_in = date.today() + timedelta(days=1)
+            self.fill(tab, **contact, **{
+                "Aadhaar Number*": "123412341234", "Hotel Name*": "Hotel Load",
+                "Check In Date*": check_in, "Check Out Date*": check_in + timedelta(days=2),
+            })
+            tab.button[0].click()
+            if self.run("hotel_request"):
+                self.request_ids.append(self.app.session_state["booking_confirmation"]["Request ID"])
+
+
+@contextmanager
+def concurrent_sessions():
+    # AppTest sets up process-wide state around each run: it installs a mock Runtime
+    # and patches the config so widgets record what the test reads back, and undoes
+    # both when the run ends, out from under the sessions still running. Here the
+    # config is patched once for the whole load test, and the last Runtime installed
+    # stays in place, as a server process has one Runtime for every session. Runs
+    # also share one ScriptCache, so the script is compiled once rather than by
+    # every session at the same time
+    latest = []
+    script_cache = ScriptCache()
+
+    def instance(cls):
+        if cls._instance is not None:
+            latest[:] = [cls._instance]
+        return latest[0]
+
+    with patch_config_options({"global.appTest": True}), \
+            mock.patch.object(app_test, "patch_config_options", lambda overrides: nullcontext()), \
+            mock.patch.object(Runtime, "instance", classmethod(instance)), \
+            mock.patch.object(Runtime, "exists", classmethod(lambda cls: True)), \
+            mock.patch.object(local_script_runner, "ScriptCache", lambda: script_cache):
+        AppTest.from_string("").run()
+        yield
+
+
+def wait_until_synced(queue, timeout):
+    deadline = time.monotonic() + timeout
+    while queue.journal.pending() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    return not queue.journal.pending()
+
+
+def run_load(users=10, iterations=1, latency=0.0, jitter=0.0, failure_rate=0.0, timeout=60, sync_timeout=120):
+    """Runs the load test and returns the timings, errors and audit of both sheets."""
+    employees = list(EmployeeDirectory.from_csv(ROSTER_PATH).by_code.values())[:users]
+    journal_dir = tempfile.mkdtemp(prefix="portal-loadtest-")
+    secrets = Secrets()
+    secrets._secrets = {
+        "storage": {
+            "backend": "memory",
+            "journal_path": os.path.join(journal_dir, "submissions.journal"),
+            "memory": {"latency": latency, "jitter": jitter, "failure_rate": failure_rate},
+        },
+    }
+    # Set once for every session instead of per AppTest, which would swap the
+    # global st.secrets back and forth under the concurrent runs
+    saved_secrets, st.secrets = st.secrets, secrets
+    saved_cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        sessions = [User(employee, timeout) for employee in employees]
+        threads = [threading.Thread(target=user.session, args=(iterations,)) for user in sessions]
+        with concurrent_sessions():
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+        from portal.resources import get_backend, get_submission_queue
+
+        synced = wait_until_synced(get_submission_queue(), sync_timeout)
+        backend = get_backend()
+        audit = {
+            TICKET_SCHEMA.name: backend.audit(TICKET_SCHEMA.name, [i for user in sessions for i in user.ticket_ids]),
+            BOOKING_SCHEMA.name: backend.audit(BOOKING_SCHEMA.name, [i for user in sessions for i in user.request_ids]),
+        }
+    finally:
+        st.secrets = saved_secrets
+        os.chdir(saved_cwd)
+
+    timings = defaultdict(list)
+    for user in sessions:
+        for step, samples in user.timings.items():
+            timings[step].extend(samples)
+    return {
+        "users": len(sessions),
+        "elapsed": elapsed,
+        "timings": dict(timings),
+        "errors": [error for user in sessions for error in user.errors],
+        "synced": synced,
+        "audit": audit,
+    }
+
+
+def report(result):
+    print(f"{result['users']} users in {result['elapsed']:.1f}s")
+    print(f"{'step':<16}{'runs':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for step in STEPS:
+        samples = result["timings"].get(step)
+        if samples:
+            p50, p95, p99 = (percentile(samples, percent) * 1000 for percent in (50, 95, 99))
+            print(f"{step:<16}{len(samples):>8}{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}")
+    runs = sum(len(samples) for samples in result["timings"].values())
+    submissions = sum(len(samples) for step, samples in result["timings"].items() if step.endswith(("ticket", "request")))
+    print(f"throughput: {runs / result['elapsed']:.1f} reruns/s, {submissions / result['elapsed']:.1f} submissions/s")
+
+    for error in result["errors"][:20]:
+        print(f"ERROR {error}")
+    if len(result["errors"]) > 20:
+        print(f"... {len(result['errors']) - 20} more errors")
+    if not result["synced"]:
+        print("Submission journal still has pending entries")
+    for worksheet, audit in result["audit"].items():
+        print(
+            f"{worksheet}: {audit['rows']} rows, {len(audit['lost'])} lost, "
+            f"{len(audit['duplicated'])} duplicated, {len(audit['unexpected'])} unexpected"
+        )
+    return not result["errors"] and result["synced"] and all(
+        not audit["lost"] and not audit["duplicated"] and not audit["unexpected"] for audit in result["audit"].values()
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=1, help="ticket + travel + hotel submissions per user")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every backend call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many more seconds per call")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of backend calls that fail")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed for one rerun")
+    args = parser.parse_args(argv)
+    result = run_load(args.users, args.iterations, args.latency, args.jitter, args.failure_rate, args.timeout)
+    return 0 if report(result) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import inspect
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Series:
+    __slots__ = ("count", "total", "rows", "bytes", "errors", "samples")
+
+    def __init__(self, window):
+        self.count = 0
+        self.total = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.errors = defaultdict(int)
+        # Percentiles are taken over the most recent `window` durations
+        self.samples = deque(maxlen=window)
+
+
+class Metrics:
+    """Timings, payload sizes and error counts per operation, e.g. "gsheets.read" or "page.Resolve Tickets".
+
+    Counts and totals cover the whole process lifetime; p50/p95/p99 are
+    computed from the last `window` samples of each operation.
+    """
+
+    def __init__(self, window=1024):
+        self.window = window
+        self.started_at = time.time()
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _get(self, operation):
+        series = self._series.get(operation)
+        if series is None:
+            series = self._series.setdefault(operation, Series(self.window))
+        return series
+
+    def observe(self, operation, seconds, rows=None, size=None, error=None):
+        with self._lock:
+            series = self._get(operation)
+            series.count += 1
+            series.total += seconds
+            series.samples.append(seconds)
+            if rows:
+                series.rows += rows
+            if size:
+                series.bytes += size
+            if error is not None:
+                series.errors[type(error).__name__] += 1
+
+    @contextmanager
+    def timer(self, operation):
+        # The yielded dict takes optional "rows" and "bytes" for the payload
+        payload = {}
+        started = time.perf_counter()
+        try:
+            yield payload
+        except Exception as e:
+            self.observe(operation, time.perf_counter() - started, error=e)
+            raise
+        self.observe(operation, time.perf_counter() - started, payload.get("rows"), payload.get("bytes"))
+
+    def reset(self):
+        with self._lock:
+            self._series = {}
+            self.started_at = time.time()
+
+    def snapshot(self):
+        with self._lock:
+            series = {operation: (s.count, s.total, s.rows, s.bytes, dict(s.errors), sorted(s.samples))
+                      for operation, s in self._series.items()}
+        rows = []
+        for operation, (count, total, payload_rows, payload_bytes, errors, samples) in sorted(series.items()):
+            rows.append({
+                "operation": operation,
+                "count": count,
+                "errors": sum(errors.values()),
+                "mean_ms": total / count * 1000 if count else 0.0,
+                **{f"p{int(q * 100)}_ms": quantile(samples, q) * 1000 for q in QUANTILES},
+                "rows": payload_rows,
+                "bytes": payload_bytes,
+                "error_types": errors,
+            })
+        return rows
+
+    def prometheus_text(self, prefix="portal"):
+        lines = [
+            f"# HELP {prefix}_operation_duration_seconds Duration of storage calls, submissions and page renders.",
+            f"# TYPE {prefix}_operation_duration_seconds summary",
+        ]
+        snapshot = self.snapshot()
+        for row in snapshot:
+            label = f'operation="{escape(row["operation"])}"'
+            for q in QUANTILES:
+                lines.append(
+                    f'{prefix}_operation_duration_seconds{{{label},quantile="{q}"}} {row[f"p{int(q * 100)}_ms"] / 1000:.6f}'
+                )
+            lines.append(f"{prefix}_operation_duration_seconds_sum{{{label}}} {row['mean_ms'] * row['count'] / 1000:.6f}")
+            lines.append(f"{prefix}_operation_duration_seconds_count{{{label}}} {row['count']}")
+        for name, column, help_text in [
+            ("rows", "rows", "Rows read or written."),
+            ("bytes", "bytes", "Payload bytes read or written."),
+        ]:
+            lines.append(f"# HELP {prefix}_operation_{name}_total {help_text}")
+            lines.append(f"# TYPE {prefix}_operation_{name}_total counter")
+            for row in snapshot:
+                lines.append(f'{prefix}_operation_{name}_total{{operation="{escape(row["operation"])}"}} {row[column]}')
+        lines.append(f"# HELP {prefix}_operation_errors_total Failed operations by exception type.")
+        lines.append(f"# TYPE {prefix}_operation_errors_total counter")
+        for row in snapshot:
+            for error_type, count in sorted(row["error_types"].items()):
+                lines.append(
+                    f'{prefix}_operation_errors_total{{operation="{escape(row["operation"])}",type="{escape(error_type)}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+def quantile(samples, q):
+    # Nearest-rank quantile of already sorted samples
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def payload_size(value):
+    # (rows, bytes) for the payloads that pass through the stores, None for anything else
+    if isinstance(value, pd.DataFrame):
+        return len(value), int(value.memory_usage(index=False, deep=True).sum())
+    if isinstance(value, list) and value and isinstance(value[0], (list, tuple)):
+        return len(value), sum(len(str(cell)) for row in value for cell in row)
+    return None
+
+
+class Metered:
+    """Wraps a store or backend and times every method call as "<name>.<method>".
+
+    Payload rows/bytes come from the result (a DataFrame or list of rows) or,
+    for writes, from the rows passed in. Generators are timed until exhausted.
+    """
+
+    def __init__(self, target, name, metrics):
+        self._target = target
+        self._name = name
+        self._metrics = metrics
+
+    def __getattr__(self, attribute):
+        value = getattr(self._target, attribute)
+        if not callable(value) or attribute.startswith("_"):
+            return value
+        operation = f"{self._name}.{attribute}"
+
+        if inspect.isgeneratorfunction(value):
+            return lambda *args, **kwargs: self._metered_generator(operation, value(*args, **kwargs))
+
+        def call(*args, **kwargs):
+            with self._metrics.timer(operation) as payload:
+                result = value(*args, **kwargs)
+                size = payload_size(result)
+                if size is None:
+                    size = next(filter(None, map(payload_size, args)), None)
+                if size is not None:
+                    payload["rows"], payload["bytes"] = size
+                return result
+
+        return call
+
+    def _metered_generator(self, operation, generator):
+        with self._metrics.timer(operation) as payload:
+            payload["rows"] = payload["bytes"] = 0
+            for item in generator:
+                size = payload_size(item)
+                if size is not None:
+                    payload["rows"] += size[0]
+                    payload["bytes"] += size[1]
+                yield item
+
+
+def write_textfile(metrics, path):
+    # Atomic replace, as the node_exporter textfile collector expects
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        f.write(metrics.prometheus_text())
+    os.replace(temporary, path)
+
+
+def start_textfile_writer(metrics, path, interval=15):
+    def run():
+        while True:
+            try:
+                write_textfile(metrics, path)
+            except OSError:
+                logger.exception("Writing metrics to %s failed", path)
+            time.sleep(interval)
+
+    threading.Thread(target=run, name="metrics-textfile", daemon=True).start()
+
+
+def start_http_server(metrics, port, host="127.0.0.1"):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+# Shared by every module in the process
+METRICS = Metrics()
@@ -0,0 +1,27 @@
+import sys
+import tomllib
+
+from storage import BOOKING_SCHEMA, DEFAULT_SQLITE_PATH, TICKET_SCHEMA, GSheetsBackend, SQLiteStore
+
+# Copies the Tickets and TravelHotelRequests worksheets into the local SQLite
+# database used when [storage] backend = "sqlite". Safe to re-run: rows whose
+# Ticket ID / Request ID already exist are skipped.
+#
+#   python migrate.py [path/to/secrets.toml]
+
+
+def main(secrets_path=".streamlit/secrets.toml"):
+    with open(secrets_path, "rb") as f:
+        secrets = tomllib.load(f)
+
+    backend = GSheetsBackend(None, secrets["connections"]["gsheets"])
+    sqlite_path = secrets.get("storage", {}).get("sqlite_path", DEFAULT_SQLITE_PATH)
+
+    for schema in (TICKET_SCHEMA, BOOKING_SCHEMA):
+        data = backend.read(schema.name, schema.columns)
+        imported = SQLiteStore(sqlite_path, schema).import_frame(data)
+        print(f"{schema.name}: imported {imported} of {len(data)} rows into {sqlite_path}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
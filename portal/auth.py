@@ -0,0 +1,67 @@
+import streamlit as st
+
+from portal.resources import get_logo, get_roster
+
+def authenticate_employee(employee_name, passkey):
+    return get_roster().get().authenticate(employee_name, passkey)
+
+def is_admin(employee_code):
+    admin_codes = st.secrets.get("admin", {}).get("employee_codes", [])
+    return str(employee_code) in [str(code) for code in admin_codes]
+
+def login_page(title):
+    # Create centered layout for logo and heading
+    col1, col2, col3 = st.columns([1, 3, 1])
+
+    with col2:
+        # Display centered logo
+        logo = get_logo()
+        if logo is not None:
+            # Already a PNG within the content width, so Streamlit serves the bytes as they are
+            st.image(logo, use_container_width=True, output_format="PNG")
+        else:
+            st.warning("Logo image not found")
+
+        # Centered heading with custom style
+        st.markdown(f"""
+        <div style='text-align: center; margin-bottom: 30px;'>
+            <h1 style='margin-bottom: 0;'>{title}</h1>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Login form
+    employee_names = get_roster().get().names
+
+    # Create centered form
+    form_col1, form_col2, form_col3 = st.columns([1, 2, 1])
+
+    with form_col2:
+        with st.container():
+            employee_name = st.selectbox(
+                "Select Your Name",
+                employee_names,
+                key="employee_select"
+            )
+            passkey = st.text_input(
+                "Password",
+                type="password",
+                key="passkey_input"
+            )
+
+            login_button = st.button(
+                "Log in",
+                key="login_button",
+                use_container_width=True
+            )
+
+            if login_button:
+                employee = authenticate_employee(employee_name, passkey)
+                if employee is not None:
+                    st.session_state.authenticated = True
+                    st.session_state.employee_name = employee.name
+                    st.session_state.employee_code = employee.code
+                    st.session_state.designation = employee.designation
+                    st.session_state.is_admin = is_admin(employee.code)
+                    st.rerun()
+                else:
+                    st.error("Invalid Employee Code. Please try again.")
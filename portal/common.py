@@ -0,0 +1,183 @@
+from datetime import timedelta
+
+import streamlit as st
+
+from confirmations import render as render_confirmation
+from export import EXPORT_CHUNK_ROWS, EXPORT_FORMATS, export_bytes
+from metrics import METRICS
+from portal.constants import PAGE_SIZES, TICKET_SLA_HOURS
+from portal.resources import get_submission_queue
+from storage import BOOKING_SCHEMA, TICKET_SCHEMA, OlderThan, Range, merge_filters  # noqa: F401 (used by the views)
+
+submissions = get_submission_queue()
+
+def log_ticket_to_gsheet(submissions, ticket_data):
+    try:
+        with METRICS.timer("submit.tickets") as payload:
+            payload["rows"] = 1
+            submissions.submit(TICKET_SCHEMA.name, [ticket_data])
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+def log_travel_hotel_request(submissions, request_data):
+    return log_travel_hotel_requests(submissions, [request_data])
+
+def log_travel_hotel_requests(submissions, requests):
+    # One journal entry, so the whole batch is written in a single append
+    try:
+        with METRICS.timer("submit.bookings") as payload:
+            payload["rows"] = len(requests)
+            submissions.submit(BOOKING_SCHEMA.name, requests)
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+def confirmation_download(kind, record, key):
+    id_column = "Ticket ID" if kind == "ticket" else "Request ID"
+    st.download_button(
+        "Download PDF Confirmation",
+        render_confirmation(kind, record),
+        f"{record[id_column]}.pdf",
+        "application/pdf",
+        key=key
+    )
+
+def pagination_controls(total, key):
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("Per page", PAGE_SIZES, key=f"{key}_page_size")
+    pages = max(1, -(-total // page_size))
+    with col2:
+        page_number = st.number_input(
+            f"Page (of {pages})",
+            min_value=1,
+            max_value=pages,
+            value=1,
+            step=1,
+            key=f"{key}_page_{pages}"
+        )
+    return (page_number - 1) * page_size, page_size
+
+def ticket_sla_hours():
+    return {**TICKET_SLA_HOURS, **st.secrets.get("sla", {})}
+
+def overdue_filters():
+    # Open tickets older than the response time promised for their priority
+    return {"Status": "Open", "Raised At": [OlderThan("Priority", ticket_sla_hours())]}
+
+def date_range_filters(column, dates):
+    # st.date_input gives (start,) while the second date is being picked
+    if not dates:
+        return {}
+    start, end = dates[0], dates[-1] + timedelta(days=1)
+    return {column: [Range(start, end)]}
+
+def filtered_count(summary, store, employee_code, filters):
+    # The summary already holds the answer unless several filters are combined
+    if not filters:
+        return summary["Total"]
+    if len(filters) == 1:
+        (column, value), = filters.items()
+        if column in summary and not isinstance(value, list):
+            return summary[column].get(value, 0)
+    return store.count(employee_code, filters)
+
+def export_controls(key, file_stem, store, filters, rows=None):
+    # Nothing is serialised until the download button is clicked; the file is then
+    # written chunk by chunk from the store (or from rows, e.g. search results) on
+    # Streamlit's download thread and held in memory while it is served
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        export_format = st.selectbox("Format", list(EXPORT_FORMATS), key=f"{key}_format")
+    extension, mime = EXPORT_FORMATS[export_format]
+
+    def build():
+        chunks = [rows] if rows is not None else store.chunks(filters, EXPORT_CHUNK_ROWS)
+        return export_bytes(chunks, export_format)
+
+    with col2:
+        st.download_button(
+            f"Download {extension.upper()}", build, f"{file_stem}.{extension}", mime,
+            key=f"{key}_download", on_click="ignore"
+        )
+
+def show_pending_submissions(records, id_column, title_column):
+    st.warning(f"{len(records)} submission(s) pending sync. They will appear below once saved.")
+    for record in records:
+        st.write(f"**{record[id_column]}** - {record[title_column]} (Pending sync)")
+    if submissions.last_error:
+        st.caption(f"Last sync attempt failed ({submissions.last_error}). Retrying automatically.")
+
+def render_ticket_details(row):
+    status_color = "red" if row['Status'] == "Open" else "green"
+    st.markdown(f"""
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <strong>Ticket ID:</strong> {row['Ticket ID']}<br>
+            <strong>Date Raised:</strong> {row['Date Raised']} at {row['Time Raised']}
+        </div>
+        <div style="color: {status_color}; font-weight: bold;">
+            {row['Status']}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.write("---")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write(f"**Your Contact Email:** {row['Raised By (Email)']}")
+        st.write(f"**Your Phone Number:** {row['Raised By (Phone)']}")
+        st.write(f"**Category:** {row['Category']}")
+    with col2:
+        st.write(f"**Priority:** {row['Priority']}")
+        if row['Date Resolved']:
+            st.write(f"**Date Resolved:** {row['Date Resolved']}")
+    
+    st.write("---")
+    st.write("**Details:**")
+    st.write(row['Details'])
+    
+    if row['Status'] == "Resolved" and row['Resolution Notes']:
+        st.write("---")
+        st.write("**Resolution Notes:**")
+        st.write(row['Resolution Notes'])
+
+def render_booking_details(row):
+    status_color = "orange" if row['Status'] == "Pending" else "green" if row['Status'] == "Approved" else "red"
+    st.markdown(f"""
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <strong>Request ID:</strong> {row['Request ID']}<br>
+            <strong>Date Requested:</strong> {row['Date Requested']} at {row['Time Requested']}
+        </div>
+        <div style="color: {status_color}; font-weight: bold;">
+            {row['Status']}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.write("---")
+    st.write(f"**Your Contact Email:** {row['Email']}")
+    st.write(f"**Your Phone Number:** {row['Phone']}")
+    st.write(f"**Adhara Number:** {row['Adhara Number']}")
+    
+    if row['Request Type'] in ["Hotel", "Travel & Hotel"]:
+        st.write("---")
+        st.write("**Hotel Details:**")
+        st.write(f"**Hotel Name:** {row['Hotel Name']}")
+        st.write(f"**Check In Date:** {row['Check In Date']}")
+        st.write(f"**Check Out Date:** {row['Check Out Date']}")
+    
+    if row['Request Type'] in ["Travel", "Travel & Hotel"]:
+        st.write("---")
+        st.write("**Travel Details:**")
+        st.write(f"**Travel Mode:** {row['Travel Mode']}")
+        st.write(f"**From:** {row['From Location']}")
+        st.write(f"**To:** {row['To Location']}")
+        st.write(f"**Booking Date:** {row['Booking Date']}")
+    
+    if row['Remarks']:
+        st.write("---")
+        st.write("**Remarks:**")
+        st.write(row['Remarks'])
@@ -0,0 +1,112 @@
+import streamlit as st
+
+# Hide Streamlit style elements
+hide_streamlit_style = """
+    <style>
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    .stActionButton > button[title="Open source on GitHub"] {visibility: hidden;}
+    header {visibility: hidden;}
+    </style>
+"""
+
+# Constants
+# Categories and priorities
+TICKET_CATEGORIES = [
+    "HR Department",
+    "MIS & Back Office",
+    "Digital & Marketing",
+    "Co-founders",
+    "Accounts",
+    "Admin Department",
+    "Travel Issue",
+    "Product - Delivery/Quantity/Quality/Missing",
+    "Others"
+]
+
+PRIORITY_LEVELS = ["Low", "Medium", "High", "Critical"]
+TRAVEL_MODES = ["Bus", "Train", "Flight", "Taxi", "Other"]
+REQUEST_TYPES = ["Hotel", "Travel", "Travel & Hotel"]
+TICKET_STATUSES = ["Open", "Resolved"]
+
+# Hours within which an open ticket gets a response, by priority; the [sla]
+# section of secrets.toml can override any of them (e.g. Critical = 8)
+TICKET_SLA_HOURS = {"Low": 48, "Medium": 48, "High": 48, "Critical": 48}
+
+# Bulk booking columns (a subset of the TravelHotelRequests sheet)
+BULK_BOOKING_COLUMNS = [
+    "Employee Code",
+    "Request Type",
+    "Email",
+    "Phone",
+    "Adhara Number",
+    "Hotel Name",
+    "Check In Date",
+    "Check Out Date",
+    "Travel Mode",
+    "From Location",
+    "To Location",
+    "Booking Date",
+    "Remarks"
+]
+BULK_BOOKING_COLUMN_CONFIG = {
+    "Request Type": st.column_config.SelectboxColumn("Request Type", options=REQUEST_TYPES),
+    "Travel Mode": st.column_config.SelectboxColumn("Travel Mode", options=TRAVEL_MODES)
+}
+
+# History views
+PAGE_SIZES = [10, 25, 50]
+SEARCH_RESULT_LIMIT = 50
+TICKET_DISPLAY_COLUMNS = [
+    "Ticket ID",
+    "Subject",
+    "Status",
+    "Priority",
+    "Category",
+    "Date Raised",
+    "Time Raised",
+    "Raised By (Email)",
+    "Raised By (Phone)",
+    "Details",
+    "Resolution Notes",
+    "Date Resolved"
+]
+BOOKING_DISPLAY_COLUMNS = [
+    "Request ID",
+    "Request Type",
+    "Status",
+    "Date Requested",
+    "Time Requested",
+    "Email",
+    "Phone",
+    "Adhara Number",
+    "Hotel Name",
+    "Check In Date",
+    "Check Out Date",
+    "Travel Mode",
+    "From Location",
+    "To Location",
+    "Booking Date",
+    "Remarks"
+]
+
+# Admin resolution console
+ADMIN_TICKET_COLUMNS = [
+    "Ticket ID",
+    "Raised By (Employee Name)",
+    "Raised At",
+    "Subject",
+    "Category",
+    "Priority",
+    "Status",
+    "Resolution Notes"
+]
+ADMIN_EDITABLE_COLUMNS = ["Category", "Priority", "Status", "Resolution Notes"]
+ADMIN_DISABLED_COLUMNS = [column for column in ADMIN_TICKET_COLUMNS if column not in ADMIN_EDITABLE_COLUMNS]
+ADMIN_TICKET_COLUMN_CONFIG = {
+    "Status": st.column_config.SelectboxColumn("Status", options=TICKET_STATUSES, required=True),
+    "Priority": st.column_config.SelectboxColumn("Priority", options=PRIORITY_LEVELS, required=True),
+    "Category": st.column_config.SelectboxColumn("Department", options=TICKET_CATEGORIES, required=True),
+    "Raised At": st.column_config.DatetimeColumn("Raised At", format="DD-MM-YYYY HH:mm")
+}
+ADMIN_SEARCH_RESULT_LIMIT = 500
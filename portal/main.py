@@ -0,0 +1,110 @@
+import importlib
+
+import streamlit as st
+
+from metrics import METRICS
+from portal.auth import login_page
+from portal.constants import hide_streamlit_style
+from portal.resources import start_metrics_export
+
+# Navigation label -> (module, page function); a page module is imported the
+# first time it is opened and stays loaded for the life of the server process
+PAGES = {
+    "Travel & Hotel Booking": ("portal.views.bookings", "travel_hotel_booking_page"),
+    "Raise Support Ticket": ("portal.views.tickets", "raise_new_request_page"),
+    "Resolve Tickets": ("portal.views.admin", "admin_resolution_page"),
+    "Diagnostics": ("portal.views.diagnostics", "diagnostics_page"),
+}
+EMPLOYEE_PAGES = ["Travel & Hotel Booking", "Raise Support Ticket"]
+ADMIN_PAGES = ["Resolve Tickets", "Diagnostics"]
+
+def load_page(page):
+    module, function = PAGES[page]
+    return getattr(importlib.import_module(module), function)
+
+def setup():
+    # Streamlit drops elements a rerun does not emit, so the style is sent every time
+    st.markdown(hide_streamlit_style, unsafe_allow_html=True)
+    start_metrics_export()
+    if 'authenticated' not in st.session_state:
+        st.session_state.authenticated = False
+    if 'employee_name' not in st.session_state:
+        st.session_state.employee_name = None
+    if 'employee_code' not in st.session_state:
+        st.session_state.employee_code = None
+    if 'designation' not in st.session_state:
+        st.session_state.designation = None
+    if 'employee_email' not in st.session_state:
+        st.session_state.employee_email = None
+    if 'employee_phone' not in st.session_state:
+        st.session_state.employee_phone = None
+    if 'is_admin' not in st.session_state:
+        st.session_state.is_admin = False
+
+def main(title):
+    """Runs one rerun of the portal; title is the login heading unless [portal] title is set."""
+    # Timed as "rerun" overall and "rerun.setup" up to the page render; the
+    # Diagnostics page reports both next to the per-page timings
+    with METRICS.timer("rerun"):
+        render(title)
+
+def render(title):
+    with METRICS.timer("rerun.setup"):
+        setup()
+    title = st.secrets.get("portal", {}).get("title", title)
+
+    if not st.session_state.authenticated:
+        with METRICS.timer("page.Login"):
+            login_page(title)
+        return
+
+    # Authenticated view
+    st.sidebar.title(f"Welcome, {st.session_state.employee_name}")
+    st.sidebar.write(f"Designation: {st.session_state.designation}")
+    st.sidebar.write(f"Employee Code: {st.session_state.employee_code}")
+
+    if st.sidebar.button("Logout"):
+        st.session_state.authenticated = False
+        st.session_state.employee_name = None
+        st.session_state.employee_code = None
+        st.session_state.designation = None
+        st.session_state.employee_email = None
+        st.session_state.employee_phone = None
+        st.session_state.is_admin = False
+        # Confirmations and bulk uploads hold the previous employee's records
+        for key in ("ticket_confirmation", "booking_confirmation", "bulk_vouchers", "bulk_booking_records"):
+            st.session_state.pop(key, None)
+        st.query_params.clear()
+        st.rerun()
+
+    # Any ticket or request can be opened directly, also via ?id=<Ticket/Request ID>
+    lookup_id = st.sidebar.text_input(
+        "Open by Ticket/Request ID",
+        value=st.query_params.get("id", ""),
+        key="lookup_id"
+    ).strip().upper()
+    if lookup_id:
+        lookup = importlib.import_module("portal.views.lookup")
+        st.query_params["id"] = lookup_id
+        st.sidebar.button("Close", key="close_lookup", on_click=lookup.clear_lookup)
+        with METRICS.timer("page.Lookup"):
+            lookup.record_detail_page(lookup_id, st.session_state.employee_code)
+        return
+
+    pages = EMPLOYEE_PAGES + (ADMIN_PAGES if st.session_state.is_admin else [])
+
+    page = st.sidebar.radio(
+        "Navigation",
+        pages,
+        index=0
+    )
+
+    with METRICS.timer(f"page.{page}"):
+        if page in ADMIN_PAGES:
+            load_page(page)()
+        else:
+            load_page(page)(
+                st.session_state.employee_name,
+                st.session_state.employee_code,
+                st.session_state.designation
+            )
@@ -0,0 +1,106 @@
+import logging
+
+import streamlit as st
+from streamlit_gsheets import GSheetsConnection
+
+from directory import RosterLoader
+from journal import DEFAULT_JOURNAL_PATH, SubmissionJournal, SubmissionQueue
+from metrics import METRICS, Metered, start_http_server, start_textfile_writer
+from storage import (
+    BOOKING_SCHEMA,
+    TICKET_SCHEMA,
+    GSheetsBackend,
+    MemoryBackend,
+    SheetStore,
+    WriteCoordinator,
+    build_store,
+    mirrors_to_sheets,
+)
+
+logger = logging.getLogger(__name__)
+
+# Process-wide objects shared by every session; each is created on first use.
+# Google Sheets by default; [storage] backend = "memory" runs against an in-process
+# fake for local load tests, with latency/jitter/failure_rate read from [storage.memory]
+@st.cache_resource
+def get_backend():
+    settings = st.secrets.get("storage", {})
+    if settings.get("backend") == "memory":
+        return Metered(MemoryBackend(**settings.get("memory", {})), "memory", METRICS)
+    conn = st.connection("gsheets", type=GSheetsConnection)
+    return Metered(GSheetsBackend(conn, st.secrets["connections"]["gsheets"]), "gsheets", METRICS)
+
+# One writer thread per worksheet for the whole server process
+@st.cache_resource
+def get_writer():
+    return WriteCoordinator(get_backend())
+
+# Worksheet copies are shared by all sessions and refreshed in the background after
+# cache_max_staleness seconds
+@st.cache_resource
+def get_sheet_stores():
+    max_staleness = st.secrets.get("storage", {}).get("cache_max_staleness", 60)
+    return (
+        SheetStore(get_backend(), TICKET_SCHEMA, writer=get_writer(), max_staleness=max_staleness),
+        SheetStore(get_backend(), BOOKING_SCHEMA, writer=get_writer(), max_staleness=max_staleness),
+    )
+
+# Storage backend is chosen by the [storage] section of secrets.toml
+# (Google Sheets by default, or SQLite with the sheets kept as a mirror)
+@st.cache_resource
+def get_stores():
+    settings = st.secrets.get("storage", {})
+    tickets, bookings = get_sheet_stores()
+    return (
+        Metered(build_store(settings, tickets), "tickets", METRICS),
+        Metered(build_store(settings, bookings), "bookings", METRICS),
+    )
+
+# Submissions are journaled to disk and acknowledged immediately; a background
+# thread writes them to the stores, and another to the sheets when they mirror SQLite
+@st.cache_resource
+def get_submission_queue():
+    settings = st.secrets.get("storage", {})
+    journal = SubmissionJournal(settings.get("journal_path", DEFAULT_JOURNAL_PATH))
+    tickets, bookings = get_stores()
+    mirrors = {}
+    if mirrors_to_sheets(settings):
+        sheet_tickets, sheet_bookings = get_sheet_stores()
+        mirrors = {TICKET_SCHEMA.name: sheet_tickets, BOOKING_SCHEMA.name: sheet_bookings}
+    return SubmissionQueue(journal, {TICKET_SCHEMA.name: tickets, BOOKING_SCHEMA.name: bookings}, mirrors)
+
+# Load employee data once per server process; edits to the CSV are picked up
+# without a restart
+@st.cache_resource
+def get_roster():
+    return RosterLoader('Invoice - Person.csv')
+
+# Logo file bytes for the login page, read once instead of decoded on every rerun;
+# None when the file is missing
+@st.cache_resource
+def get_logo():
+    try:
+        with open("logo.png", "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+# Prometheus text export, configured by the [metrics] section of secrets.toml:
+# textfile = "/var/lib/node_exporter/portal.prom" and/or port = 9464 (serves /metrics).
+# A failed export is logged, not raised: the result is cached either way, so a taken
+# port neither breaks every rerun nor starts another textfile thread on each retry
+@st.cache_resource
+def start_metrics_export():
+    settings = st.secrets.get("metrics", {})
+    if settings.get("textfile"):
+        try:
+            start_textfile_writer(METRICS, settings["textfile"], settings.get("interval", 15))
+        except (OSError, RuntimeError):
+            logger.exception("Could not start writing metrics to %s", settings["textfile"])
+    if settings.get("port"):
+        host, port = settings.get("host", "127.0.0.1"), int(settings["port"])
+        try:
+            start_http_server(METRICS, port, host)
+        except OSError:
+            logger.exception("Could not serve metrics on %s:%s", host, port)
+    return True
@@ -0,0 +1,133 @@
+from datetime import datetime
+
+import streamlit as st
+
+from portal.common import date_range_filters, export_controls, merge_filters, overdue_filters, submissions
+from portal.constants import (
+    ADMIN_DISABLED_COLUMNS,
+    ADMIN_EDITABLE_COLUMNS,
+    ADMIN_SEARCH_RESULT_LIMIT,
+    ADMIN_TICKET_COLUMN_CONFIG,
+    ADMIN_TICKET_COLUMNS,
+    TICKET_CATEGORIES,
+)
+from portal.resources import get_stores
+from storage import TICKET_SCHEMA
+
+ticket_store, _ = get_stores()
+
+def collect_ticket_updates(original, edited):
+    # Compare only the editable columns and build {Ticket ID: {column: value}}
+    before = original[ADMIN_EDITABLE_COLUMNS].fillna("")
+    after = edited[ADMIN_EDITABLE_COLUMNS].fillna("")
+    changed = (before != after).any(axis=1)
+    today = datetime.now().strftime("%d-%m-%Y")
+    
+    updates = {}
+    for ticket_id, old, new in zip(
+        original.loc[changed, "Ticket ID"],
+        before[changed].to_dict("records"),
+        after[changed].to_dict("records")
+    ):
+        values = {column: new[column] for column in ADMIN_EDITABLE_COLUMNS if new[column] != old[column]}
+        if values.get("Status") == "Resolved":
+            values["Date Resolved"] = today
+        elif "Status" in values:
+            values["Date Resolved"] = ""
+        updates[ticket_id] = values
+    return updates
+
+def update_tickets(submissions, updates):
+    # Written to the store now; a sheet mirror gets them through the submission journal
+    try:
+        submissions.update(TICKET_SCHEMA.name, updates)
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+def admin_resolution_page():
+    st.title("Resolve Tickets")
+    
+    if 'resolution_editor_version' not in st.session_state:
+        st.session_state.resolution_editor_version = 0
+    if st.session_state.get('resolution_message'):
+        st.success(st.session_state.pop('resolution_message'))
+    
+    queue = st.radio(
+        "Queue",
+        ["All tickets", "Past response time"],
+        horizontal=True,
+        key="admin_queue"
+    )
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        status_filter = st.selectbox(
+            "Status",
+            ["Open", "Resolved", "All"],
+            key="admin_status_filter",
+            disabled=queue == "Past response time"
+        )
+    with col2:
+        category_filter = st.selectbox(
+            "Department",
+            ["All"] + TICKET_CATEGORIES,
+            key="admin_category_filter"
+        )
+    with col3:
+        raised_between = st.date_input("Raised between", value=(), format="DD-MM-YYYY", key="admin_raised_between")
+    
+    search_text = st.text_input(
+        "Search",
+        placeholder="Search subject and details across all tickets",
+        key="admin_ticket_search"
+    ).strip()
+    
+    filters = merge_filters(
+        {
+            column: value
+            for column, value in [("Status", status_filter), ("Category", category_filter)]
+            if value != "All"
+        },
+        date_range_filters("Raised At", raised_between),
+        overdue_filters() if queue == "Past response time" else {},
+    )
+    try:
+        if search_text:
+            tickets = ticket_store.search(search_text, filters=filters, limit=ADMIN_SEARCH_RESULT_LIMIT)
+            tickets = tickets[ADMIN_TICKET_COLUMNS]
+        else:
+            tickets = ticket_store.select(filters, columns=ADMIN_TICKET_COLUMNS)
+    except Exception as e:
+        st.error(f"Error retrieving support tickets: {str(e)}")
+        return
+    
+    if tickets.empty:
+        st.info("No tickets match these filters.")
+        return
+    
+    st.write(f"{len(tickets)} ticket(s). Edit status, priority, department or notes, then save all changes at once.")
+    with st.expander("Export these tickets"):
+        export_controls("export_admin_tickets", "tickets", ticket_store, filters, rows=tickets if search_text else None)
+    edited = st.data_editor(
+        tickets,
+        key=f"resolution_editor_{st.session_state.resolution_editor_version}",
+        hide_index=True,
+        use_container_width=True,
+        disabled=ADMIN_DISABLED_COLUMNS,
+        column_config=ADMIN_TICKET_COLUMN_CONFIG
+    )
+    
+    if st.button("Save Changes", key="save_resolutions"):
+        updates = collect_ticket_updates(tickets, edited)
+        if not updates:
+            st.info("No changes to save.")
+            return
+        with st.spinner(f"Updating {len(updates)} ticket(s)..."):
+            success, error = update_tickets(submissions, updates)
+        if success:
+            # Start the editor from the saved state on the next run
+            st.session_state.resolution_editor_version += 1
+            st.session_state.resolution_message = f"Updated {len(updates)} ticket(s)."
+            st.rerun()
+        else:
+            st.error(f"Failed to update tickets: {error}")
@@ -0,0 +1,441 @@
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from confirmations import render_batch
+from ids import generate_request_id
+from portal.common import (
+    confirmation_download,
+    date_range_filters,
+    export_controls,
+    filtered_count,
+    log_travel_hotel_request,
+    log_travel_hotel_requests,
+    merge_filters,
+    pagination_controls,
+    render_booking_details,
+    show_pending_submissions,
+    submissions,
+)
+from portal.constants import (
+    BOOKING_DISPLAY_COLUMNS,
+    BULK_BOOKING_COLUMN_CONFIG,
+    BULK_BOOKING_COLUMNS,
+    REQUEST_TYPES,
+    TRAVEL_MODES,
+)
+from portal.resources import get_roster, get_stores
+from storage import BOOKING_SCHEMA
+
+_, booking_store = get_stores()
+
+def parse_booking_date(value):
+    try:
+        return datetime.strptime(str(value).strip(), "%d-%m-%Y").date()
+    except ValueError:
+        return None
+
+def build_bulk_booking_records(bookings):
+    # Validates every row first; returns (records, []) or ([], errors) so that
+    # either the whole trip is submitted or nothing is
+    directory = get_roster().get()
+    bookings = bookings.fillna("").astype(str).apply(lambda column: column.str.strip())
+    bookings = bookings[(bookings != "").any(axis=1)]
+    if bookings.empty:
+        return [], ["Add at least one traveller."]
+    
+    today = datetime.now().date()
+    current_date = datetime.now().strftime("%d-%m-%Y")
+    current_time = datetime.now().strftime("%H:%M:%S")
+    records, errors = [], []
+    for number, row in enumerate(bookings.to_dict("records"), start=1):
+        problems = []
+        employee = directory.get(row["Employee Code"])
+        if employee is None:
+            problems.append(f"unknown employee code '{row['Employee Code']}'")
+        request_type = row["Request Type"]
+        if request_type not in REQUEST_TYPES:
+            problems.append(f"request type must be one of {', '.join(REQUEST_TYPES)}")
+        if "@" not in row["Email"]:
+            problems.append("invalid email")
+        if not row["Phone"].isdigit() or len(row["Phone"]) < 10:
+            problems.append("invalid phone number")
+        if not row["Adhara Number"]:
+            problems.append("Aadhaar number is required")
+        
+        if request_type in ["Hotel", "Travel & Hotel"]:
+            check_in = parse_booking_date(row["Check In Date"])
+            check_out = parse_booking_date(row["Check Out Date"])
+            if not row["Hotel Name"]:
+                problems.append("hotel name is required")
+            if check_in is None or check_out is None:
+                problems.append("check in/out dates must be DD-MM-YYYY")
+            elif check_in < today or check_out < check_in:
+                problems.append("check in must not be in the past and check out must not be before check in")
+        if request_type in ["Travel", "Travel & Hotel"]:
+            booking_date = parse_booking_date(row["Booking Date"])
+            if row["Travel Mode"] not in TRAVEL_MODES:
+                problems.append(f"travel mode must be one of {', '.join(TRAVEL_MODES)}")
+            if not row["From Location"] or not row["To Location"]:
+                problems.append("from and to locations are required")
+            if booking_date is None or booking_date < today:
+                problems.append("booking date must be DD-MM-YYYY and not in the past")
+        
+        if problems:
+            errors.append(f"Row {number}: " + "; ".join(problems))
+            continue
+        
+        includes_hotel = request_type in ["Hotel", "Travel & Hotel"]
+        includes_travel = request_type in ["Travel", "Travel & Hotel"]
+        records.append({
+            "Request ID": generate_request_id(),
+            "Request Type": request_type,
+            "Employee Name": employee.name,
+            "Employee Code": employee.code,
+            "Designation": employee.designation,
+            "Email": row["Email"],
+            "Phone": row["Phone"],
+            "Adhara Number": row["Adhara Number"],
+            "Hotel Name": row["Hotel Name"] if includes_hotel else "",
+            "Check In Date": row["Check In Date"] if includes_hotel else "",
+            "Check Out Date": row["Check Out Date"] if includes_hotel else "",
+            "Travel Mode": row["Travel Mode"] if includes_travel else "",
+            "From Location": row["From Location"] if includes_travel else "",
+            "To Location": row["To Location"] if includes_travel else "",
+            "Booking Date": row["Booking Date"] if includes_travel else "",
+            "Remarks": row["Remarks"],
+            "Status": "Pending",
+            "Date Requested": current_date,
+            "Time Requested": current_time
+        })
+    
+    return ([], errors) if errors else (records, [])
+
+def bulk_booking_tab():
+    st.subheader("Bulk Booking")
+    st.write(
+        "Add one row per traveller, or upload a CSV with the columns "
+        f"{', '.join(BULK_BOOKING_COLUMNS)}. Dates use DD-MM-YYYY."
+    )
+    
+    uploaded = st.file_uploader("Upload CSV", type="csv", key="bulk_booking_csv")
+    if uploaded is not None:
+        bookings = pd.read_csv(uploaded, dtype=str, keep_default_na=False)
+        bookings = bookings.reindex(columns=BULK_BOOKING_COLUMNS, fill_value="")
+    else:
+        bookings = pd.DataFrame({column: pd.Series(dtype=str) for column in BULK_BOOKING_COLUMNS})
+    
+    edited = st.data_editor(
+        bookings,
+        key=f"bulk_booking_editor_{uploaded.name if uploaded is not None else 'manual'}",
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        column_config=BULK_BOOKING_COLUMN_CONFIG
+    )
+    
+    if st.button("Submit All Requests", key="submit_bulk_bookings"):
+        records, errors = build_bulk_booking_records(edited)
+        if errors:
+            st.error("No requests were submitted. Please fix the following:\n\n" + "\n".join(f"- {error}" for error in errors))
+        else:
+            success, error = log_travel_hotel_requests(submissions, records)
+            if success:
+                st.session_state.bulk_booking_records = records
+                st.session_state.pop('bulk_vouchers', None)
+                st.success(f"{len(records)} requests submitted successfully!")
+            else:
+                st.error(f"Failed to submit requests: {error}")
+    
+    records = st.session_state.get('bulk_booking_records')
+    if records:
+        st.dataframe(
+            pd.DataFrame(records)[["Request ID", "Employee Name", "Request Type"]],
+            hide_index=True
+        )
+        if st.session_state.get('bulk_vouchers'):
+            st.download_button(
+                f"Download {len(records)} Vouchers (ZIP)",
+                st.session_state.bulk_vouchers,
+                "booking_vouchers.zip",
+                "application/zip",
+                key="bulk_vouchers_download"
+            )
+        elif st.button("Prepare Vouchers", key="prepare_bulk_vouchers"):
+            with st.spinner(f"Rendering {len(records)} vouchers..."):
+                st.session_state.bulk_vouchers = render_batch("booking", records)
+            st.rerun()
+
+def travel_hotel_booking_page(employee_name, employee_code, designation):
+    st.title("Travel & Hotel Booking")
+    
+    tab_names = ["Travel Request", "Hotel Booking Request", "My Booking Requests"]
+    if st.session_state.get('is_admin'):
+        tab_names.append("Bulk Booking")
+    tabs = st.tabs(tab_names)
+    tab1, tab2, tab3 = tabs[:3]
+    
+    with tab1:
+        st.subheader("New Travel Request")
+        with st.form("travel_form"):
+            # Employee contact info
+            col1, col2 = st.columns(2)
+            with col1:
+                employee_email = st.text_input(
+                    "Your Email*",
+                    value=st.session_state.get('employee_email', ''),
+                    placeholder="your.email@company.com",
+                    help="Please provide your contact email"
+                )
+            with col2:
+                employee_phone = st.text_input(
+                    "Your Phone Number*",
+                    value=st.session_state.get('employee_phone', ''),
+                    placeholder="9876543210",
+                    help="Please provide your contact number"
+                )
+            
+            adhara_number = st.text_input(
+                "Aadhaar Number*",
+                placeholder="Enter your Aadhaar number",
+                help="Required for travel bookings"
+            )
+            
+            # Travel details
+            travel_mode = st.selectbox("Travel Mode*", TRAVEL_MODES)
+            booking_date = st.date_input("Booking Date*", min_value=datetime.now())
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                from_location = st.text_input("From*", placeholder="Starting location")
+            with col2:
+                to_location = st.text_input("To*", placeholder="Destination")
+            
+            remarks = st.text_area(
+                "Remarks",
+                placeholder="Any special requirements or additional information...",
+                height=100
+            )
+            
+            st.markdown("<small>*Required fields</small>", unsafe_allow_html=True)
+            
+            submitted = st.form_submit_button("Submit Travel Request")
+            
+            if submitted:
+                if not employee_email or not employee_phone or not adhara_number or not travel_mode or not from_location or not to_location or not booking_date:
+                    st.error("Please fill in all required fields (marked with *)")
+                elif not employee_email.strip() or "@" not in employee_email:
+                    st.error("Please enter a valid email address")
+                elif not employee_phone.strip().isdigit() or len(employee_phone.strip()) < 10:
+                    st.error("Please enter a valid 10-digit phone number")
+                else:
+                    with st.spinner("Submitting your travel request..."):
+                        request_id = generate_request_id()
+                        current_date = datetime.now().strftime("%d-%m-%Y")
+                        current_time = datetime.now().strftime("%H:%M:%S")
+                        
+                        request_data = {
+                            "Request ID": request_id,
+                            "Request Type": "Travel",
+                            "Employee Name": employee_name,
+                            "Employee Code": employee_code,
+                            "Designation": designation,
+                            "Email": employee_email.strip(),
+                            "Phone": employee_phone.strip(),
+                            "Adhara Number": adhara_number.strip(),
+                            "Hotel Name": "",
+                            "Check In Date": "",
+                            "Check Out Date": "",
+                            "Travel Mode": travel_mode,
+                            "From Location": from_location,
+                            "To Location": to_location,
+                            "Booking Date": booking_date.strftime("%d-%m-%Y"),
+                            "Remarks": remarks,
+                            "Status": "Pending",
+                            "Date Requested": current_date,
+                            "Time Requested": current_time
+                        }
+                        
+                        success, error = log_travel_hotel_request(submissions, request_data)
+                        
+                        if success:
+                            st.session_state.booking_confirmation = request_data
+                            st.session_state.employee_email = employee_email.strip()
+                            st.session_state.employee_phone = employee_phone.strip()
+                            st.success(f"""
+                            Your travel request has been submitted successfully! 
+                            **Request ID:** {request_id}
+                            """)
+                            st.balloons()
+                        else:
+                            st.error(f"Failed to submit request: {error}")
+        
+        if st.session_state.get('booking_confirmation', {}).get("Request Type") == "Travel":
+            confirmation_download("booking", st.session_state.booking_confirmation, "travel_confirmation_pdf")
+    
+    with tab2:
+        st.subheader("Hotel Booking Request")
+        with st.form("hotel_form"):
+            # Employee contact info
+            col1, col2 = st.columns(2)
+            with col1:
+                employee_email = st.text_input(
+                    "Your Email*",
+                    value=st.session_state.get('employee_email', ''),
+                    placeholder="your.email@company.com",
+                    help="Please provide your contact email"
+                )
+            with col2:
+                employee_phone = st.text_input(
+                    "Your Phone Number*",
+                    value=st.session_state.get('employee_phone', ''),
+                    placeholder="9876543210",
+                    help="Please provide your contact number"
+                )
+            
+            adhara_number = st.text_input(
+                "Aadhaar Number*",
+                placeholder="Enter your Aadhaar number",
+                help="Required for hotel bookings"
+            )
+            
+            hotel_name = st.text_input("Hotel Name*")
+            col1, col2 = st.columns(2)
+            with col1:
+                check_in_date = st.date_input("Check In Date*", min_value=datetime.now())
+            with col2:
+                check_out_date = st.date_input("Check Out Date*", min_value=datetime.now())
+            
+            remarks = st.text_area(
+                "Remarks",
+                placeholder="Any special requirements or additional information...",
+                height=100
+            )
+            
+            st.markdown("<small>*Required fields</small>", unsafe_allow_html=True)
+            
+            submitted = st.form_submit_button("Submit Hotel Booking Request")
+            
+            if submitted:
+                if not employee_email or not employee_phone or not adhara_number or not hotel_name or not check_in_date or not check_out_date:
+                    st.error("Please fill in all required fields (marked with *)")
+                elif not employee_email.strip() or "@" not in employee_email:
+                    st.error("Please enter a valid email address")
+                elif not employee_phone.strip().isdigit() or len(employee_phone.strip()) < 10:
+                    st.error("Please enter a valid 10-digit phone number")
+                else:
+                    with st.spinner("Submitting your hotel booking request..."):
+                        request_id = generate_request_id()
+                        current_date = datetime.now().strftime("%d-%m-%Y")
+                        current_time = datetime.now().strftime("%H:%M:%S")
+                        
+                        request_data = {
+                            "Request ID": request_id,
+                            "Request Type": "Hotel",
+                            "Employee Name": employee_name,
+                            "Employee Code": employee_code,
+                            "Designation": designation,
+                            "Email": employee_email.strip(),
+                            "Phone": employee_phone.strip(),
+                            "Adhara Number": adhara_number.strip(),
+                            "Hotel Name": hotel_name,
+                            "Check In Date": check_in_date.strftime("%d-%m-%Y"),
+                            "Check Out Date": check_out_date.strftime("%d-%m-%Y"),
+                            "Travel Mode": "",
+                            "From Location": "",
+                            "To Location": "",
+                            "Booking Date": "",
+                            "Remarks": remarks,
+                            "Status": "Pending",
+                            "Date Requested": current_date,
+                            "Time Requested": current_time
+                        }
+                        
+                        success, error = log_travel_hotel_request(submissions, request_data)
+                        
+                        if success:
+                            st.session_state.booking_confirmation = request_data
+                            st.session_state.employee_email = employee_email.strip()
+                            st.session_state.employee_phone = employee_phone.strip()
+                            st.success(f"""
+                            Your hotel booking request has been submitted successfully! 
+                            **Request ID:** {request_id}
+                            """)
+                            st.balloons()
+                        else:
+                            st.error(f"Failed to submit request: {error}")
+        
+        if st.session_state.get('booking_confirmation', {}).get("Request Type") == "Hotel":
+            confirmation_download("booking", st.session_state.booking_confirmation, "hotel_confirmation_pdf")
+    
+    with tab3:
+        view_my_booking_requests(employee_code)
+    
+    if len(tabs) > 3:
+        with tabs[3]:
+            bulk_booking_tab()
+
+def view_my_booking_requests(employee_code):
+    st.subheader("My Travel & Hotel Requests")
+    try:
+        pending = submissions.pending_records(BOOKING_SCHEMA.name, BOOKING_SCHEMA.employee_column, employee_code)
+        if pending:
+            show_pending_submissions(pending, "Request ID", "Request Type")
+        
+        summary = booking_store.summary(employee_code)
+        
+        if summary["Total"]:
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Total Requests", summary["Total"])
+            col2.metric("Pending", summary["Status"].get("Pending", 0))
+            col3.metric("Approved", summary["Status"].get("Approved", 0))
+            
+            st.subheader("Filter Requests")
+            col1, col2 = st.columns(2)
+            with col1:
+                status_filter = st.selectbox(
+                    "Status",
+                    ["All", "Pending", "Approved", "Rejected"],
+                    key="request_status_filter"
+                )
+            with col2:
+                type_filter = st.selectbox(
+                    "Request Type",
+                    ["All"] + REQUEST_TYPES,
+                    key="request_type_filter"
+                )
+            requested_between = st.date_input(
+                "Requested between", value=(), format="DD-MM-YYYY", key="requested_between"
+            )
+            
+            filters = merge_filters(
+                {
+                    column: value
+                    for column, value in [("Status", status_filter), ("Request Type", type_filter)]
+                    if value != "All"
+                },
+                date_range_filters("Requested At", requested_between),
+            )
+            matching_count = filtered_count(summary, booking_store, employee_code, filters)
+            offset, page_size = pagination_controls(matching_count, "requests")
+            
+            # Only the visible page is fetched, and only the columns shown below
+            page = booking_store.page(employee_code, filters, offset, page_size, columns=BOOKING_DISPLAY_COLUMNS)
+            for row in page.to_dict("records"):
+                with st.expander(f"{row['Request Type']} - {row['Status']}"):
+                    render_booking_details(row)
+            
+            if matching_count:
+                st.caption(f"Showing {offset + 1}-{offset + len(page)} of {matching_count} requests")
+                export_controls(
+                    "export_requests",
+                    "my_travel_requests",
+                    booking_store,
+                    {BOOKING_SCHEMA.employee_column: employee_code, **filters},
+                )
+        else:
+            st.info("You haven't made any travel/hotel requests yet.")
+            
+    except Exception as e:
+        st.error(f"Error retrieving travel/hotel requests: {str(e)}")
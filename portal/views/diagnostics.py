@@ -0,0 +1,90 @@
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from metrics import METRICS
+from portal.common import submissions
+from portal.resources import get_stores
+
+ticket_store, booking_store = get_stores()
+
+TIMING_COLUMN_CONFIG = {
+    column: st.column_config.NumberColumn(column, format="%.1f")
+    for column in ["mean_ms", "p50_ms", "p95_ms", "p99_ms"]
+}
+
+def diagnostics_page():
+    st.title("Diagnostics")
+    
+    snapshot = METRICS.snapshot()
+    uptime = datetime.now().timestamp() - METRICS.started_at
+    st.caption(f"Collected over the last {uptime / 60:.0f} minutes; percentiles cover the latest {METRICS.window} calls of each operation.")
+    
+    # Whole reruns, the shared setup and each page render, slowest first
+    reruns = [row for row in snapshot if row["operation"] == "rerun" or row["operation"].startswith(("rerun.", "page."))]
+    st.subheader("Reruns")
+    if reruns:
+        st.dataframe(
+            pd.DataFrame(reruns)[["operation", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms"]]
+            .sort_values("p50_ms", ascending=False),
+            hide_index=True,
+            use_container_width=True,
+            column_config=TIMING_COLUMN_CONFIG
+        )
+    else:
+        st.info("No reruns recorded yet.")
+    
+    st.subheader("Operations")
+    if snapshot:
+        operations = pd.DataFrame(snapshot).drop(columns=["error_types"])
+        st.dataframe(
+            operations,
+            hide_index=True,
+            use_container_width=True,
+            column_config=TIMING_COLUMN_CONFIG
+        )
+    else:
+        st.info("No operations recorded yet.")
+    
+    errors = [
+        {"operation": row["operation"], "type": error_type, "count": count}
+        for row in snapshot
+        for error_type, count in row["error_types"].items()
+    ]
+    st.subheader("Errors")
+    if errors:
+        st.dataframe(pd.DataFrame(errors), hide_index=True, use_container_width=True)
+    else:
+        st.write("No errors recorded.")
+    
+    st.subheader("Caches and Sync")
+    col1, col2, col3 = st.columns(3)
+    for column, (label, store) in zip([col1, col2], [("Tickets", ticket_store), ("Bookings", booking_store)]):
+        cache = getattr(store, "cache", None)
+        if cache is not None:
+            stats = cache.stats()
+            lookups = stats["hits"] + stats["misses"]
+            column.metric(f"{label} cache rows", stats["rows"])
+            column.caption(f"Hit rate {stats['hits'] / lookups:.0%} of {lookups} lookups" if lookups else "No lookups yet")
+    col3.metric("Submissions pending sync", len(submissions.journal.pending(target="store")))
+    if submissions.last_error:
+        col3.caption(f"Last sync error: {submissions.last_error}")
+    if submissions.mirrors:
+        col3.metric("Pending sheet mirror writes", len(submissions.journal.pending(target="mirror")))
+        if submissions.mirror_error:
+            col3.caption(f"Last mirror error: {submissions.mirror_error}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "Download Prometheus Metrics",
+            METRICS.prometheus_text(),
+            "portal_metrics.prom",
+            "text/plain",
+            key="download_metrics"
+        )
+    with col2:
+        if st.button("Reset Metrics", key="reset_metrics"):
+            METRICS.reset()
+            st.rerun()
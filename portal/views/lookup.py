@@ -0,0 +1,41 @@
+import streamlit as st
+
+from portal.common import confirmation_download, render_booking_details, render_ticket_details, submissions
+from portal.resources import get_stores
+from storage import BOOKING_SCHEMA, TICKET_SCHEMA
+
+ticket_store, booking_store = get_stores()
+
+def record_detail_page(record_id, employee_code):
+    st.title(record_id)
+    if record_id.startswith("REQ-"):
+        store, schema, render_details = booking_store, BOOKING_SCHEMA, render_booking_details
+    else:
+        store, schema, render_details = ticket_store, TICKET_SCHEMA, render_ticket_details
+    
+    def visible(record):
+        # Employees can open their own tickets and requests; admins can open any
+        return st.session_state.is_admin or str(record[schema.employee_column]) == str(employee_code)
+    
+    try:
+        record = store.get(record_id)
+    except Exception as e:
+        st.error(f"Error retrieving {record_id}: {str(e)}")
+        return
+    
+    kind = "booking" if schema is BOOKING_SCHEMA else "ticket"
+    if record is not None and visible(record):
+        render_details(record)
+        confirmation_download(kind, record, "record_confirmation_pdf")
+        return
+    
+    pending = [record for record in submissions.pending_records(schema.name, schema.key, record_id) if visible(record)]
+    if pending:
+        st.info("This submission is pending sync.")
+        render_details(pending[0])
+    else:
+        st.warning(f"No ticket or request found with ID {record_id}.")
+
+def clear_lookup():
+    st.session_state.lookup_id = ""
+    st.query_params.clear()
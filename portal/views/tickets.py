@@ -0,0 +1,220 @@
+from datetime import datetime
+
+import streamlit as st
+
+from ids import generate_ticket_id
+from portal.common import (
+    confirmation_download,
+    date_range_filters,
+    export_controls,
+    filtered_count,
+    log_ticket_to_gsheet,
+    merge_filters,
+    overdue_filters,
+    pagination_controls,
+    render_ticket_details,
+    show_pending_submissions,
+    submissions,
+    ticket_sla_hours,
+)
+from portal.constants import PRIORITY_LEVELS, SEARCH_RESULT_LIMIT, TICKET_CATEGORIES, TICKET_DISPLAY_COLUMNS
+from portal.resources import get_stores
+from storage import TICKET_SCHEMA
+
+ticket_store, _ = get_stores()
+
+def raise_new_request_page(employee_name, employee_code, designation):
+    st.title("Raise Support Ticket")
+    
+    tab1, tab2 = st.tabs(["Raise New Ticket", "My Support Requests"])
+    
+    with tab1:
+        st.subheader("Raise New Support Ticket")
+        with st.form("ticket_form"):
+            # Employee contact info
+            col1, col2 = st.columns(2)
+            with col1:
+                employee_email = st.text_input(
+                    "Your Email*",
+                    placeholder="your.email@company.com",
+                    help="Please provide your contact email"
+                )
+            with col2:
+                employee_phone = st.text_input(
+                    "Your Phone Number*",
+                    placeholder="9876543210",
+                    help="Please provide your contact number"
+                )
+            
+            # Ticket details
+            col1, col2 = st.columns(2)
+            with col1:
+                category = st.selectbox(
+                    "Department",
+                    TICKET_CATEGORIES,
+                    help="Select the most relevant category for your ticket"
+                )
+            with col2:
+                priority = st.selectbox(
+                    "Priority*",
+                    PRIORITY_LEVELS,
+                    index=1,  # Default to Medium
+                    help="How urgent is this issue?"
+                )
+            
+            subject = st.text_input(
+                "Subject*",
+                max_chars=100,
+                placeholder="Brief description of your ticket",
+                help="Keep it concise but descriptive"
+            )
+            
+            details = st.text_area(
+                "Details*",
+                height=200,
+                placeholder="Please provide detailed information about your ticket...",
+                help="Include all relevant details to help resolve your issue quickly"
+            )
+            
+            st.markdown("<small>*Required fields</small>", unsafe_allow_html=True)
+            
+            submitted = st.form_submit_button("Submit Ticket")
+            
+            if submitted:
+                if not subject or not details or not employee_email or not employee_phone:
+                    st.error("Please fill in all required fields (marked with *)")
+                elif not employee_email.strip() or "@" not in employee_email:
+                    st.error("Please enter a valid email address")
+                elif not employee_phone.strip().isdigit() or len(employee_phone.strip()) < 10:
+                    st.error("Please enter a valid 10-digit phone number")
+                else:
+                    with st.spinner("Submitting your ticket..."):
+                        ticket_id = generate_ticket_id()
+                        current_date = datetime.now().strftime("%d-%m-%Y")
+                        current_time = datetime.now().strftime("%H:%M:%S")
+                        
+                        ticket_data = {
+                            "Ticket ID": ticket_id,
+                            "Raised By (Employee Name)": employee_name,
+                            "Raised By (Employee Code)": employee_code,
+                            "Raised By (Designation)": designation,
+                            "Raised By (Email)": employee_email.strip(),
+                            "Raised By (Phone)": employee_phone.strip(),
+                            "Category": category,
+                            "Subject": subject,
+                            "Details": details,
+                            "Status": "Open",
+                            "Date Raised": current_date,
+                            "Time Raised": current_time,
+                            "Resolution Notes": "",
+                            "Date Resolved": "",
+                            "Priority": priority
+                        }
+                        
+                        success, error = log_ticket_to_gsheet(submissions, ticket_data)
+                        
+                        if success:
+                            st.session_state.ticket_confirmation = ticket_data
+                            st.success(f"""
+                            Your ticket has been submitted successfully! 
+                            We will update you within {ticket_sla_hours()[priority]} hours regarding this matter.
+                            
+                            **Ticket ID:** {ticket_id}
+                            **Priority:** {priority}
+                            """)
+                            st.balloons()
+                        else:
+                            st.error(f"Failed to submit ticket: {error}")
+        
+        if st.session_state.get('ticket_confirmation'):
+            confirmation_download("ticket", st.session_state.ticket_confirmation, "ticket_confirmation_pdf")
+    
+    with tab2:
+        view_my_support_requests(employee_code)
+
+def view_my_support_requests(employee_code):
+    st.subheader("My Support Tickets")
+    try:
+        pending = submissions.pending_records(TICKET_SCHEMA.name, TICKET_SCHEMA.employee_column, employee_code)
+        if pending:
+            show_pending_submissions(pending, "Ticket ID", "Subject")
+        
+        summary = ticket_store.summary(employee_code)
+        
+        if summary["Total"]:
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Total Tickets", summary["Total"])
+            col2.metric("Open", summary["Status"].get("Open", 0))
+            col3.metric("Resolved", summary["Status"].get("Resolved", 0))
+            if summary["Status"].get("Open", 0):
+                col4.metric("Past Response Time", ticket_store.count(employee_code, overdue_filters()))
+            
+            st.subheader("Filter Tickets")
+            search_text = st.text_input(
+                "Search",
+                placeholder="Search subject and details, e.g. laptop charger",
+                key="ticket_search"
+            ).strip()
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                status_filter = st.selectbox(
+                    "Status",
+                    ["All", "Open", "Resolved"],
+                    key="status_filter"
+                )
+            with col2:
+                priority_filter = st.selectbox(
+                    "Priority",
+                    ["All"] + PRIORITY_LEVELS,
+                    key="priority_filter"
+                )
+            with col3:
+                category_filter = st.selectbox(
+                    "Category",
+                    ["All"] + TICKET_CATEGORIES,
+                    key="category_filter"
+                )
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                raised_between = st.date_input("Raised between", value=(), format="DD-MM-YYYY", key="raised_between")
+            with col2:
+                overdue_only = st.checkbox("Past response time only", key="overdue_filter")
+            
+            filters = merge_filters(
+                {
+                    column: value
+                    for column, value in [("Status", status_filter), ("Priority", priority_filter), ("Category", category_filter)]
+                    if value != "All"
+                },
+                date_range_filters("Raised At", raised_between),
+                overdue_filters() if overdue_only else {},
+            )
+            if search_text:
+                # Full-text matches, newest first, narrowed by the filters above
+                page = ticket_store.search(search_text, employee_code, filters, limit=SEARCH_RESULT_LIMIT)
+                page = page[TICKET_DISPLAY_COLUMNS]
+                matching_count, offset = len(page), 0
+            else:
+                matching_count = filtered_count(summary, ticket_store, employee_code, filters)
+                offset, page_size = pagination_controls(matching_count, "tickets")
+                
+                # Only the visible page is fetched, and only the columns shown below
+                page = ticket_store.page(employee_code, filters, offset, page_size, columns=TICKET_DISPLAY_COLUMNS)
+            for row in page.to_dict("records"):
+                with st.expander(f"{row['Subject']} - {row['Status']} ({row['Priority']})"):
+                    render_ticket_details(row)
+            
+            if matching_count:
+                st.caption(f"Showing {offset + 1}-{offset + len(page)} of {matching_count} tickets")
+                export_controls(
+                    "export_tickets",
+                    "my_support_tickets",
+                    ticket_store,
+                    {TICKET_SCHEMA.employee_column: employee_code, **filters},
+                    rows=page if search_text else None,
+                )
+        else:
+            st.info("You haven't raised any support tickets yet.")
+            
+    except Exception as e:
+        st.error(f"Error retrieving support tickets: {str(e)}")
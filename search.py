@@ -0,0 +1,88 @@
+import bisect
+import heapq
+import re
+from collections import defaultdict
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+MIN_PREFIX_LENGTH = 3
+
+
+def tokenize(text):
+    return set(TOKEN_PATTERN.findall(str(text).lower()))
+
+
+class InvertedIndex:
+    """Token -> record keys over a few text columns, kept current as rows are added.
+
+    Follows the same empty/rebuild/add/replace protocol as the cache indexes.
+    Queries AND their terms together; with prefix matching the last term also
+    matches longer tokens ("charg" finds "charger"). Results are newest first,
+    which for our date-prefixed IDs is descending key order.
+    """
+
+    def __init__(self, key_position, owner_position, text_positions):
+        self.key_position = key_position
+        self.owner_position = owner_position
+        self.text_positions = text_positions
+        self.rebuild([])
+
+    def empty(self):
+        return InvertedIndex(self.key_position, self.owner_position, self.text_positions)
+
+    def _tokens(self, row):
+        tokens = set()
+        for position in self.text_positions:
+            tokens |= tokenize(row[position])
+        return tokens
+
+    def rebuild(self, rows):
+        self.postings = defaultdict(set)
+        self.by_owner = defaultdict(set)
+        for row in rows:
+            key = row[self.key_position]
+            self.by_owner[row[self.owner_position]].add(key)
+            for token in self._tokens(row):
+                self.postings[token].add(key)
+        self.vocabulary = sorted(self.postings)
+
+    def add(self, rows):
+        for row in rows:
+            key = row[self.key_position]
+            self.by_owner[row[self.owner_position]].add(key)
+            for token in self._tokens(row):
+                if token not in self.postings:
+                    bisect.insort(self.vocabulary, token)
+                self.postings[token].add(key)
+
+    def replace(self, old_row, new_row):
+        old_tokens, new_tokens = self._tokens(old_row), self._tokens(new_row)
+        if old_tokens == new_tokens:
+            return
+        key = new_row[self.key_position]
+        for token in old_tokens - new_tokens:
+            self.postings[token].discard(key)
+        self.add([new_row])
+
+    def _matches(self, term, prefix):
+        if not prefix or len(term) < MIN_PREFIX_LENGTH:
+            return self.postings.get(term, set())
+        start = end = bisect.bisect_left(self.vocabulary, term)
+        while end < len(self.vocabulary) and self.vocabulary[end].startswith(term):
+            end += 1
+        return set().union(*(self.postings[token] for token in self.vocabulary[start:end]))
+
+    def search(self, text, owner=None, prefix=True, limit=50):
+        terms = TOKEN_PATTERN.findall(str(text).lower())
+        if not terms:
+            return []
+        candidates = [self._matches(term, prefix and number == len(terms) - 1) for number, term in enumerate(terms)]
+        if owner is not None:
+            candidates.append(self.by_owner.get(owner, set()))
+        candidates.sort(key=len)
+        keys = set(candidates[0])
+        for other in candidates[1:]:
+            keys &= other
+            if not keys:
+                return []
+        # Only the newest `limit` keys are ordered, not every match
+        return sorted(keys, reverse=True) if limit is None else heapq.nlargest(limit, keys)
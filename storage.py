@@ -0,0 +1,918 @@
+import bisect
+import calendar
+import logging
+import queue
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from datetime import datetime
+
+import gspread
+import pandas as pd
+
+from cache import CountIndex, KeyIndex, SheetCache
+from search import InvertedIndex
+
+logger = logging.getLogger(__name__)
+
+TICKET_SHEET_COLUMNS = [
+    "Ticket ID",
+    "Raised By (Employee Name)",
+    "Raised By (Employee Code)",
+    "Raised By (Designation)",
+    "Raised By (Email)",
+    "Raised By (Phone)",
+    "Category",
+    "Subject",
+    "Details",
+    "Status",
+    "Date Raised",
+    "Time Raised",
+    "Resolution Notes",
+    "Date Resolved",
+    "Priority"
+]
+
+TRAVEL_HOTEL_COLUMNS = [
+    "Request ID",
+    "Request Type",
+    "Employee Name",
+    "Employee Code",
+    "Designation",
+    "Email",
+    "Phone",
+    "Adhara Number",
+    "Hotel Name",
+    "Check In Date",
+    "Check Out Date",
+    "Travel Mode",
+    "From Location",
+    "To Location",
+    "Booking Date",
+    "Remarks",
+    "Status",
+    "Date Requested",
+    "Time Requested"
+]
+
+DEFAULT_SQLITE_PATH = "portal.db"
+
+# How the app writes dates and times into the sheets
+DATE_FORMAT = "%d-%m-%Y"
+TIME_FORMAT = "%H:%M:%S"
+EPOCH = pd.Timestamp(0)
+
+
+def parse_epoch(date, time=None):
+    # Seconds since 1970 for a sheet date (and time), read as wall-clock time; None if unparseable
+    attempts = [(f"{date} {time}", f"{DATE_FORMAT} {TIME_FORMAT}")] if time else []
+    for text, pattern in attempts + [(str(date), DATE_FORMAT)]:
+        try:
+            return calendar.timegm(datetime.strptime(text.strip(), pattern).timetuple())
+        except ValueError:
+            continue
+    return None
+
+
+def parse_epochs(dates, times=None):
+    # Vectorised parse_epoch over whole columns, used when a sheet is loaded
+    parsed = pd.to_datetime(dates, format=DATE_FORMAT, errors="coerce")
+    if times is not None:
+        combined = pd.to_datetime(
+            dates.astype(str) + " " + times.astype(str), format=f"{DATE_FORMAT} {TIME_FORMAT}", errors="coerce"
+        )
+        parsed = combined.fillna(parsed)
+    seconds = (parsed - EPOCH) // pd.Timedelta(seconds=1)
+    return [None if pd.isna(value) else int(value) for value in seconds]
+
+
+def to_epoch(value):
+    # datetime or date (wall-clock, like the sheets) -> epoch seconds
+    if value is None or isinstance(value, int):
+        return value
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    return calendar.timegm(value.timetuple())
+
+
+class Condition:
+    """Filter value for a timestamp column; plain filter values are matched for equality.
+
+    check() returns a row predicate for the cached rows, sql() a WHERE clause,
+    and bounds() the (start, end) epoch window it can match, which lets the
+    stores narrow the scan with their timestamp index first.
+    """
+
+    def bounds(self):
+        return None, None
+
+
+class Range(Condition):
+    """start <= timestamp < end; either bound may be None."""
+
+    def __init__(self, start=None, end=None):
+        self.start = to_epoch(start)
+        self.end = to_epoch(end)
+
+    def bounds(self):
+        return self.start, self.end
+
+    def __repr__(self):
+        return f"Range({self.start!r}, {self.end!r})"
+
+    def check(self, position, columns):
+        start, end = self.start, self.end
+        return lambda row: (
+            row[position] is not None
+            and (start is None or row[position] >= start)
+            and (end is None or row[position] < end)
+        )
+
+    def sql(self, column):
+        clauses, params = [f"{quote_identifier(column)} IS NOT NULL"], []
+        if self.start is not None:
+            clauses.append(f"{quote_identifier(column)} >= ?")
+            params.append(self.start)
+        if self.end is not None:
+            clauses.append(f"{quote_identifier(column)} < ?")
+            params.append(self.end)
+        return " AND ".join(clauses), params
+
+
+class OlderThan(Condition):
+    """Timestamps more than hours[row[by]] hours before now, e.g. SLA hours by Priority.
+
+    Rows whose `by` value has no entry never match.
+    """
+
+    def __init__(self, by, hours, now=None):
+        now = to_epoch(now or datetime.now())
+        self.by = by
+        self.hours = dict(hours)
+        self.cutoffs = {value: now - int(float(limit) * 3600) for value, limit in hours.items()}
+
+    def bounds(self):
+        return None, max(self.cutoffs.values(), default=None)
+
+    def __repr__(self):
+        # Independent of now, so the same filter compares equal across reruns
+        return f"OlderThan({self.by!r}, {self.hours!r})"
+
+    def check(self, position, columns):
+        by, cutoffs = columns.index(self.by), self.cutoffs
+        return lambda row: row[position] is not None and row[by] in cutoffs and row[position] < cutoffs[row[by]]
+
+    def sql(self, column):
+        if not self.cutoffs:
+            return "0", []
+        clause = f"({quote_identifier(self.by)} = ? AND {quote_identifier(column)} < ?)"
+        params = [item for pair in self.cutoffs.items() for item in pair]
+        return "(" + " OR ".join([clause] * len(self.cutoffs)) + ")", params
+
+
+def conditions(value):
+    # A filter value is one condition or a list of them that must all hold
+    return value if isinstance(value, list) else [value]
+
+
+def merge_filters(*parts):
+    # Every part must hold, so a column given twice keeps both conditions: a Status
+    # of "Resolved" with the overdue filter's "Open" matches nothing
+    filters = {}
+    for part in parts:
+        for column, value in part.items():
+            if column not in filters or filters[column] == value:
+                filters[column] = value
+            else:
+                filters[column] = conditions(filters[column]) + conditions(value)
+    return filters
+
+
+def condition_bounds(value):
+    starts, ends = [], []
+    for condition in conditions(value):
+        if isinstance(condition, Condition):
+            start, end = condition.bounds()
+            if start is not None:
+                starts.append(start)
+            if end is not None:
+                ends.append(end)
+    return max(starts, default=None), min(ends, default=None)
+
+
+class TableSchema:
+    """Worksheet/table layout shared by every store implementation.
+
+    timestamps maps a derived column to the (date column, time column) it is
+    parsed from, e.g. "Raised At" from "Date Raised" and "Time Raised". The sheet
+    keeps its text columns; the stores hold each timestamp as epoch seconds after
+    the sheet columns and hand it out as datetime64, so ordering and date ranges
+    do not depend on DD-MM-YYYY strings.
+    """
+
+    def __init__(self, name, columns, key, employee_column, indexes=(), summary_columns=(), text_columns=(),
+                 timestamps=None):
+        self.name = name
+        self.columns = columns
+        self.key = key
+        self.employee_column = employee_column
+        self.indexes = list(indexes)
+        self.summary_columns = list(summary_columns)
+        self.text_columns = list(text_columns)
+        self.timestamps = dict(timestamps or {})
+        self.all_columns = columns + list(self.timestamps)
+        # Newest first is by the first timestamp (when the record was created)
+        self.sort_column = next(iter(self.timestamps), None)
+        self.timestamp_sources = {column for pair in self.timestamps.values() for column in pair if column}
+
+    def epochs(self, record):
+        # record: sheet column -> value
+        return {
+            name: parse_epoch(record.get(date), record.get(time) if time else None)
+            for name, (date, time) in self.timestamps.items()
+        }
+
+    def with_timestamps(self, rows):
+        return [row + list(self.epochs(dict(zip(self.columns, row))).values()) for row in rows]
+
+    def typed(self, data):
+        for name in self.timestamps:
+            if name in data:
+                data[name] = pd.to_datetime(data[name], unit="s")
+        return data
+
+    def to_frame(self, rows, columns=None):
+        data = self.typed(pd.DataFrame(rows, columns=self.all_columns))
+        return data[columns] if columns else data
+
+    def search_index(self):
+        return InvertedIndex(
+            self.columns.index(self.key),
+            self.columns.index(self.employee_column),
+            [self.columns.index(column) for column in self.text_columns],
+        )
+
+
+TICKET_SCHEMA = TableSchema(
+    "Tickets",
+    TICKET_SHEET_COLUMNS,
+    key="Ticket ID",
+    employee_column="Raised By (Employee Code)",
+    indexes=[("Raised By (Employee Code)", "Status", "Raised At"), "Status", "Raised At"],
+    summary_columns=["Status", "Priority", "Category"],
+    text_columns=["Subject", "Details"],
+    timestamps={"Raised At": ("Date Raised", "Time Raised"), "Resolved At": ("Date Resolved", None)},
+)
+
+BOOKING_SCHEMA = TableSchema(
+    "TravelHotelRequests",
+    TRAVEL_HOTEL_COLUMNS,
+    key="Request ID",
+    employee_column="Employee Code",
+    indexes=[("Employee Code", "Status", "Requested At"), "Status", "Requested At"],
+    summary_columns=["Status", "Request Type"],
+    timestamps={"Requested At": ("Date Requested", "Time Requested")},
+)
+
+
+def cell_value(value):
+    return "" if value is None or pd.isna(value) else str(value)
+
+
+def to_sheet_rows(data, columns):
+    # gspread only accepts plain JSON values, so normalise NaN/None and numpy scalars
+    frame = data.reindex(columns=columns)
+    frame = frame.astype(object).where(frame.notna(), "")
+    return [[str(value) for value in row] for row in frame.itertuples(index=False, name=None)]
+
+
+class GSheetsBackend:
+    """Google Sheets access: reads go through the Streamlit connection, appends through gspread."""
+
+    def __init__(self, conn, settings):
+        self.conn = conn
+        self.settings = dict(settings)
+        self._spreadsheet = None
+        self._worksheets = {}
+        self._lock = threading.Lock()
+
+    def _worksheet(self, name):
+        with self._lock:
+            if self._spreadsheet is None:
+                client = gspread.service_account_from_dict(self.settings)
+                self._spreadsheet = client.open_by_url(self.settings["spreadsheet"])
+            if name not in self._worksheets:
+                self._worksheets[name] = self._spreadsheet.worksheet(name)
+            return self._worksheets[name]
+
+    def read(self, worksheet, columns, ttl=5):
+        if self.conn is None:
+            # Outside a Streamlit session (e.g. migrate.py) read straight through gspread
+            values = self._worksheet(worksheet).get_all_values()[1:]
+            rows = [(row + [""] * len(columns))[:len(columns)] for row in values]
+            data = pd.DataFrame(rows, columns=columns).replace("", None)
+        else:
+            data = self.conn.read(worksheet=worksheet, usecols=list(range(len(columns))), ttl=ttl)
+        return data.dropna(how="all")
+
+    def append_rows(self, worksheet, rows):
+        # values.append inserts after the last row of the table in a single request,
+        # so the cost does not depend on how many rows the sheet already holds
+        return self._worksheet(worksheet).append_rows(
+            rows,
+            value_input_option="RAW",
+            insert_data_option="INSERT_ROWS",
+            table_range="A1",
+        )
+
+    def find_row(self, worksheet, key, columns):
+        # Scans only the key column, then fetches the one matching row
+        sheet = self._worksheet(worksheet)
+        keys = sheet.col_values(1)
+        if key not in keys:
+            return None
+        values = sheet.row_values(keys.index(key) + 1)
+        return (values + [""] * len(columns))[:len(columns)]
+
+    def read_keys(self, worksheet, row_numbers):
+        # Column A of the given rows in one values.batchGet request
+        values = self._worksheet(worksheet).batch_get([f"A{number}" for number in row_numbers])
+        return {number: value[0][0] if value and value[0] else "" for number, value in zip(row_numbers, values)}
+
+    def update_cells(self, worksheet, cells):
+        # Every changed cell goes out in one values.batchUpdate request
+        self._worksheet(worksheet).batch_update(
+            [
+                {"range": gspread.utils.rowcol_to_a1(row, column), "values": [[value]]}
+                for row, column, value in cells
+            ],
+            value_input_option="RAW",
+        )
+
+
+class MemoryBackend:
+    """In-memory stand-in for the Google Sheets backend, used for local runs and load tests.
+
+    Every call waits latency seconds plus up to jitter more, outside the lock as
+    a network round trip would, and fails with ConnectionError at failure_rate.
+    A failed write may still have landed (after_write_failure_rate), like a
+    request that times out after the sheet was updated.
+    """
+
+    def __init__(self, sheets=None, latency=0.0, jitter=0.0, failure_rate=0.0, after_write_failure_rate=0.0,
+                 seed=None):
+        self.sheets = {name: [list(row) for row in rows] for name, rows in (sheets or {}).items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.after_write_failure_rate = after_write_failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _round_trip(self, rate):
+        with self._lock:
+            delay = self.latency + self.jitter * self._random.random()
+            fail = self._random.random() < rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise ConnectionError("Injected backend failure")
+
+    def read(self, worksheet, columns, ttl=5):
+        self._round_trip(self.failure_rate)
+        with self._lock:
+            rows = [list(row) for row in self.sheets.get(worksheet, [])]
+        return pd.DataFrame(rows, columns=columns).dropna(how="all")
+
+    def append_rows(self, worksheet, rows):
+        self._round_trip(self.failure_rate)
+        with self._lock:
+            sheet = self.sheets.setdefault(worksheet, [])
+            start = len(sheet) + 2
+            sheet.extend(list(row) for row in rows)
+            end = len(sheet) + 1
+        self._round_trip(self.after_write_failure_rate)
+        return {"updates": {"updatedRange": f"{worksheet}!A{start}:A{end}", "updatedRows": len(rows)}}
+
+    def find_row(self, worksheet, key, columns):
+        self._round_trip(self.failure_rate)
+        with self._lock:
+            for row in self.sheets.get(worksheet, []):
+                if row and row[0] == key:
+                    return [cell_value(value) for value in row]
+        return None
+
+    def read_keys(self, worksheet, row_numbers):
+        self._round_trip(self.failure_rate)
+        with self._lock:
+            sheet = self.sheets.get(worksheet, [])
+            return {
+                number: sheet[number - 2][0] if 0 <= number - 2 < len(sheet) and sheet[number - 2] else ""
+                for number in row_numbers
+            }
+
+    def update_cells(self, worksheet, cells):
+        self._round_trip(self.failure_rate)
+        with self._lock:
+            sheet = self.sheets[worksheet]
+            for row, column, value in cells:
+                sheet[row - 2][column - 1] = value
+
+    def audit(self, worksheet, expected_keys):
+        # Compares the keys in column A with the keys that were submitted
+        with self._lock:
+            counts = Counter(row[0] for row in self.sheets.get(worksheet, []) if row)
+        expected = set(expected_keys)
+        return {
+            "rows": sum(counts.values()),
+            "lost": sorted(expected - set(counts)),
+            "duplicated": {key: count for key, count in counts.items() if count > 1},
+            "unexpected": sorted(set(counts) - expected),
+        }
+
+
+def first_appended_row(response):
+    # "Tickets!A57:O60" -> 57
+    updated_range = ((response or {}).get("updates") or {}).get("updatedRange", "")
+    match = re.search(r"![A-Z]+(\d+)", updated_range)
+    return int(match.group(1)) if match else None
+
+
+class WriteCoordinator:
+    """Single writer per worksheet: callers queue rows and wait, one thread talks to the backend.
+
+    Concurrent submissions are coalesced into one append, and no lock is held while
+    the request is in flight, so N submissions always become exactly N rows.
+    """
+
+    def __init__(self, backend, max_batch_rows=500):
+        self.backend = backend
+        self.max_batch_rows = max_batch_rows
+        self._queues = {}
+        self._lock = threading.Lock()
+
+    def submit(self, worksheet, rows):
+        future = Future()
+        self._queue(worksheet).put((rows, future))
+        return future
+
+    def _queue(self, worksheet):
+        with self._lock:
+            if worksheet not in self._queues:
+                pending = queue.Queue()
+                threading.Thread(
+                    target=self._drain,
+                    args=(worksheet, pending),
+                    name=f"sheet-writer-{worksheet}",
+                    daemon=True,
+                ).start()
+                self._queues[worksheet] = pending
+            return self._queues[worksheet]
+
+    def _drain(self, worksheet, pending):
+        while True:
+            batch = [pending.get()]
+            batch_rows = len(batch[0][0])
+            while batch_rows < self.max_batch_rows:
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+                batch_rows += len(item[0])
+
+            rows = [row for item_rows, _ in batch for row in item_rows]
+            try:
+                response = self.backend.append_rows(worksheet, rows)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            start = first_appended_row(response)
+            for item_rows, future in batch:
+                future.set_result(start)
+                if start is not None:
+                    start += len(item_rows)
+
+
+class SheetStore:
+    def __init__(self, backend, schema, writer=None, max_staleness=60):
+        self.backend = backend
+        self.schema = schema
+        self.writer = writer
+        self.cache = SheetCache(self._load, schema.columns.index(schema.key), max_staleness)
+        employee_position = schema.columns.index(schema.employee_column)
+        self._by_employee = self.cache.add_index(KeyIndex(employee_position))
+        self._summaries = self.cache.add_index(
+            CountIndex(employee_position, {column: schema.columns.index(column) for column in schema.summary_columns})
+        )
+        self._search = self.cache.add_index(schema.search_index()) if schema.text_columns else None
+
+    def _load(self):
+        data = self.backend.read(self.schema.name, self.schema.columns, ttl=0)
+        rows = to_sheet_rows(data, self.schema.columns)
+        # Index labels survive dropna, so label 0 is sheet row 2 (below the header)
+        row_numbers = [int(label) + 2 for label in data.index]
+        if not self.schema.timestamps:
+            return rows, row_numbers
+        epochs = [
+            parse_epochs(data[date], data[time] if time else None)
+            for date, time in self.schema.timestamps.values()
+        ]
+        rows = [row + list(values) for row, values in zip(rows, zip(*epochs))]
+        # Hold rows oldest first, so newest first is a reverse walk; rows without a
+        # parseable date keep their sheet order at the start
+        order = sorted(range(len(rows)), key=lambda i: rows[i][len(self.schema.columns)] or 0)
+        return [rows[i] for i in order], [row_numbers[i] for i in order]
+
+    def _refresh_timestamps(self, row):
+        values = self.schema.epochs(dict(zip(self.schema.columns, row)))
+        row[len(self.schema.columns):] = values.values()
+
+    def _employee_filters(self, employee_code, filters):
+        return {self.schema.employee_column: str(employee_code), **(filters or {})}
+
+    def _checks(self, filters):
+        checks = []
+        for column, value in filters.items():
+            position = self.schema.all_columns.index(column)
+            for condition in conditions(value):
+                if isinstance(condition, Condition):
+                    checks.append(condition.check(position, self.schema.all_columns))
+                else:
+                    checks.append(lambda row, position=position, condition=condition: row[position] == condition)
+        return checks
+
+    def _rows(self, filters, offset=0, limit=None):
+        # Matching rows newest first, from offset and at most limit of them. The
+        # employee's rows, or a date window found by bisection (rows are in
+        # sort_column order), are sliced under the cache lock and only the slice is
+        # copied; other filters are checked on the copy
+        filters = dict(filters or {})
+        employee_code = filters.pop(self.schema.employee_column, None)
+        checks = self._checks(filters)
+        start, end = condition_bounds(filters.get(self.schema.sort_column))
+        position = self.schema.all_columns.index(self.schema.sort_column)
+        key = lambda row: row[position] or 0
+
+        def newest(rows, offset=0, limit=None):
+            low = 0 if start is None else bisect.bisect_left(rows, start, key=key)
+            high = len(rows) if end is None else bisect.bisect_left(rows, end, key=key)
+            stop = max(high - offset, low)
+            return rows[low if limit is None else max(low, stop - limit):stop][::-1]
+
+        page = () if checks else (offset, limit)
+        if employee_code is None:
+            rows = self.cache.call(newest, *page)
+        else:
+            rows = self.cache.query(self._by_employee, lambda index: newest(index.groups.get(str(employee_code), []), *page))
+        if checks:
+            rows = [row for row in rows if all(check(row) for check in checks)]
+            rows = rows[offset:None if limit is None else offset + limit]
+        return rows
+
+    def select(self, filters=None, offset=0, limit=None, columns=None):
+        # Newest first; the cache holds rows in timestamp order and appends are the newest
+        return self.schema.to_frame(self._rows(filters, offset, limit), columns)
+
+    def count(self, employee_code, filters=None):
+        return len(self._rows(self._employee_filters(employee_code, filters)))
+
+    def chunks(self, filters=None, chunk_size=5000, columns=None):
+        # Newest first, chunk_size rows per frame; at least one (possibly empty) frame
+        rows = self._rows(filters)
+        for start in range(0, max(len(rows), 1), chunk_size):
+            yield self.schema.to_frame(rows[start:start + chunk_size], columns)
+
+    def search(self, text, employee_code=None, filters=None, limit=50):
+        owner = None if employee_code is None else str(employee_code)
+        checks = self._checks(filters or {})
+        keys = self.cache.query(
+            self._search, lambda index: index.search(text, owner=owner, limit=None if checks else limit)
+        )
+        rows = self.cache.find(keys)
+        rows = [row for row in rows if all(check(row) for check in checks)]
+        data = self.schema.to_frame(rows[:limit])
+        if self.schema.sort_column:
+            data = data.sort_values(self.schema.sort_column, ascending=False, kind="stable", ignore_index=True)
+        return data
+
+    def get(self, key):
+        # Served from the shared copy when it is warm, otherwise a single-row fetch
+        row = self.cache.peek(key)
+        if row is None:
+            row = self.backend.find_row(self.schema.name, key, self.schema.columns)
+        return None if row is None else dict(zip(self.schema.columns, row))
+
+    def existing_keys(self, keys, refresh=False):
+        if refresh:
+            self.cache.reload()
+        return self.cache.keys_present(keys)
+
+    def summary(self, employee_code):
+        return self.cache.lookup(self._summaries, str(employee_code))
+
+    def page(self, employee_code, filters=None, offset=0, limit=None, columns=None):
+        return self.select(self._employee_filters(employee_code, filters), offset, limit, columns)
+
+    def _row_numbers(self, keys):
+        # Sheet rows for keys, checked against the key column just before writing: the
+        # copy may predate a sort, insert or delete made by hand, so a key that is
+        # missing or no longer in its row forces one reload and a second lookup
+        for attempt in range(2):
+            if attempt:
+                self.cache.reload()
+            row_numbers = self.cache.locate(keys)
+            missing = [key for key, number in row_numbers.items() if number is None]
+            if missing:
+                continue
+            found = self.backend.read_keys(self.schema.name, list(row_numbers.values()))
+            moved = [key for key, number in row_numbers.items() if found.get(number) != key]
+            if not moved:
+                return row_numbers
+        if missing:
+            raise KeyError(f"Not found in {self.schema.name}: {', '.join(missing)}")
+        raise RuntimeError(f"Rows in {self.schema.name} moved during the update, try again: {', '.join(moved)}")
+
+    def update_many(self, updates):
+        # updates: key -> {column: value}; written as targeted cell updates
+        row_numbers = self._row_numbers(list(updates))
+        cells = [
+            (row_numbers[key], self.schema.columns.index(column) + 1, cell_value(value))
+            for key, values in updates.items()
+            for column, value in values.items()
+        ]
+        self.backend.update_cells(self.schema.name, cells)
+        self.cache.update({
+            key: {self.schema.columns.index(column): cell_value(value) for column, value in values.items()}
+            for key, values in updates.items()
+        }, self._refresh_timestamps)
+
+    def append(self, data, wait=True):
+        rows = to_sheet_rows(data, self.schema.columns)
+        cached = self.schema.with_timestamps(rows)
+        if self.writer is None:
+            first_row = first_appended_row(self.backend.append_rows(self.schema.name, rows))
+        else:
+            future = self.writer.submit(self.schema.name, rows)
+            if not wait:
+                future.add_done_callback(lambda done: done.exception() is None and self.cache.append(cached, done.result()))
+                return future
+            first_row = future.result()
+        self.cache.append(cached, first_row)
+        return first_row
+
+
+def quote_identifier(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SQLiteStore:
+    """Local SQLite table (WAL mode) with the same columns as the worksheet."""
+
+    def __init__(self, path, schema):
+        self.path = path
+        self.schema = schema
+        self.table = quote_identifier(schema.name)
+        self.column_list = ", ".join(quote_identifier(column) for column in schema.all_columns)
+        self.order = (
+            f"ORDER BY {quote_identifier(schema.sort_column)} DESC, rowid DESC" if schema.sort_column
+            else "ORDER BY rowid DESC"
+        )
+        self._local = threading.local()
+        self._search = None
+        self._search_rowid = 0
+        self._search_lock = threading.Lock()
+        self._create_schema()
+
+    def _connection(self):
+        # sqlite3 connections are not shared between threads; WAL lets the
+        # per-thread readers run alongside the single writer
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _create_schema(self):
+        columns = [
+            f"{quote_identifier(column)} TEXT" + (" PRIMARY KEY" if column == self.schema.key else "")
+            for column in self.schema.columns
+        ] + [f"{quote_identifier(name)} INTEGER" for name in self.schema.timestamps]
+        with self._connection() as connection:
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({', '.join(columns)})")
+            self._add_timestamp_columns(connection)
+            for columns in self.schema.indexes:
+                # A tuple is a composite index: (employee, Status, timestamp) narrows an
+                # employee's history by status before any other filter is checked
+                columns = columns if isinstance(columns, tuple) else (columns,)
+                index = quote_identifier(f"idx_{self.schema.name}_{'_'.join(columns)}")
+                column_list = ", ".join(quote_identifier(column) for column in columns)
+                connection.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {self.table} ({column_list})")
+            # Statistics let the planner prefer a timestamp range over the Status index;
+            # analysis_limit samples the indexes so this stays cheap on large tables
+            connection.execute("PRAGMA analysis_limit=1000")
+            connection.execute(f"ANALYZE {self.table}")
+
+    def _add_timestamp_columns(self, connection):
+        # Databases created before the timestamp columns existed are filled in once
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({self.table})")}
+        missing = [name for name in self.schema.timestamps if name not in existing]
+        if not missing:
+            return
+        for name in missing:
+            connection.execute(f"ALTER TABLE {self.table} ADD COLUMN {quote_identifier(name)} INTEGER")
+        sources = ", ".join(quote_identifier(column) for column in self.schema.columns)
+        records = [dict(zip(self.schema.columns, row)) for row in connection.execute(f"SELECT {sources} FROM {self.table}")]
+        assignments = ", ".join(f"{quote_identifier(name)} = ?" for name in missing)
+        connection.executemany(
+            f"UPDATE {self.table} SET {assignments} WHERE {quote_identifier(self.schema.key)} = ?",
+            [
+                [self.schema.epochs(record)[name] for name in missing] + [record[self.schema.key]]
+                for record in records
+            ],
+        )
+        logger.info("Added %s to %d rows in %s", ", ".join(missing), len(records), self.schema.name)
+
+    def _query(self, where="", params=(), order="ORDER BY rowid", columns=None):
+        column_list = ", ".join(quote_identifier(column) for column in columns) if columns else self.column_list
+        sql = f"SELECT {column_list} FROM {self.table} {where} {order}"
+        return self.schema.typed(pd.read_sql_query(sql, self._connection(), params=params))
+
+    def _where(self, filters):
+        clauses, params = [], []
+        for column, value in (filters or {}).items():
+            for condition in conditions(value):
+                if isinstance(condition, Condition):
+                    clause, values = condition.sql(column)
+                else:
+                    clause, values = f"{quote_identifier(column)} = ?", [str(condition)]
+                clauses.append(clause)
+                params.extend(values)
+        if not clauses:
+            return "", []
+        return "WHERE " + " AND ".join(clauses), params
+
+    def _employee_filters(self, employee_code, filters):
+        return {self.schema.employee_column: str(employee_code), **(filters or {})}
+
+    def select(self, filters=None, offset=0, limit=None, columns=None):
+        where, params = self._where(filters)
+        params += [-1 if limit is None else limit, offset]
+        return self._query(where, params, order=f"{self.order} LIMIT ? OFFSET ?", columns=columns)
+
+    def count(self, employee_code, filters=None):
+        where, params = self._where(self._employee_filters(employee_code, filters))
+        return self._connection().execute(f"SELECT COUNT(*) FROM {self.table} {where}", params).fetchone()[0]
+
+    def chunks(self, filters=None, chunk_size=5000, columns=None):
+        # Streams the query result chunk_size rows at a time
+        column_list = ", ".join(quote_identifier(column) for column in columns) if columns else self.column_list
+        where, params = self._where(filters)
+        sql = f"SELECT {column_list} FROM {self.table} {where} {self.order}"
+        empty = True
+        for chunk in pd.read_sql_query(sql, self._connection(), params=params, chunksize=chunk_size):
+            empty = False
+            yield self.schema.typed(chunk)
+        if empty:
+            yield self.schema.to_frame([], columns)
+
+    def _search_keys(self, text, owner, limit):
+        # The index is built from the table on first use. Before each query it picks up
+        # rows inserted since, whether by this process, another one sharing the
+        # database, or migrate.py; MAX(rowid) is an index lookup, so this is cheap
+        with self._search_lock:
+            last_rowid = self._connection().execute(f"SELECT MAX(rowid) FROM {self.table}").fetchone()[0] or 0
+            if self._search is None:
+                self._search, self._search_rowid = self.schema.search_index(), 0
+            if last_rowid != self._search_rowid:
+                columns = ", ".join(quote_identifier(column) for column in self.schema.columns)
+                cursor = self._connection().execute(
+                    f"SELECT {columns} FROM {self.table} WHERE rowid > ? AND rowid <= ?",
+                    (self._search_rowid, last_rowid),
+                )
+                self._search.add([["" if value is None else value for value in row] for row in cursor])
+                self._search_rowid = last_rowid
+            return self._search.search(text, owner=owner, limit=limit)
+
+    def search(self, text, employee_code=None, filters=None, limit=50):
+        owner = None if employee_code is None else str(employee_code)
+        keys = self._search_keys(text, owner, None if filters else limit)
+        where, params = self._where(filters)
+        key = quote_identifier(self.schema.key)
+        found = []
+        # Keys come newest first; stop once enough of them pass the filters. The hits are
+        # fetched by key before the filters apply, so the planner cannot pick a filter's
+        # index (e.g. Status) and scan most of the table instead
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            sql = (
+                f"WITH hits AS MATERIALIZED (SELECT rowid AS rowid, * FROM {self.table} WHERE {key} IN ({placeholders})) "
+                f"SELECT {self.column_list} FROM hits {where} {self.order}"
+            )
+            found.append(self.schema.typed(pd.read_sql_query(sql, self._connection(), params=chunk + params)))
+            if sum(len(data) for data in found) >= limit:
+                break
+        if not found:
+            return self.schema.to_frame([])
+        return pd.concat(found, ignore_index=True).head(limit)
+
+    def get(self, key):
+        columns = ", ".join(quote_identifier(column) for column in self.schema.columns)
+        cursor = self._connection().execute(
+            f"SELECT {columns} FROM {self.table} WHERE {quote_identifier(self.schema.key)} = ?", (key,)
+        )
+        row = cursor.fetchone()
+        return None if row is None else dict(zip(self.schema.columns, row))
+
+    def existing_keys(self, keys, refresh=False):
+        key = quote_identifier(self.schema.key)
+        keys = list(keys)
+        found = set()
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor = self._connection().execute(
+                f"SELECT {key} FROM {self.table} WHERE {key} IN ({placeholders})", chunk
+            )
+            found.update(row[0] for row in cursor)
+        return found
+
+    def summary(self, employee_code):
+        # Every count for the dashboard tiles in one grouped scan of the employee's rows
+        columns = self.schema.summary_columns
+        column_list = ", ".join(quote_identifier(column) for column in columns)
+        where, params = self._where(self._employee_filters(employee_code, None))
+        cursor = self._connection().execute(
+            f"SELECT {column_list}, COUNT(*) FROM {self.table} {where} GROUP BY {column_list}", params
+        )
+        summary = {"Total": 0, **{column: {} for column in columns}}
+        for *values, count in cursor:
+            summary["Total"] += count
+            for column, value in zip(columns, values):
+                summary[column][value] = summary[column].get(value, 0) + count
+        return summary
+
+    def page(self, employee_code, filters=None, offset=0, limit=None, columns=None):
+        return self.select(self._employee_filters(employee_code, filters), offset, limit, columns)
+
+    def _insert(self, data, verb):
+        rows = self.schema.with_timestamps(to_sheet_rows(data, self.schema.columns))
+        placeholders = ", ".join("?" for _ in self.schema.all_columns)
+        with self._connection() as connection:
+            cursor = connection.executemany(
+                f"{verb} INTO {self.table} ({self.column_list}) VALUES ({placeholders})", rows
+            )
+        return cursor.rowcount
+
+    def append(self, data):
+        self._insert(data, "INSERT")
+
+    def import_frame(self, data):
+        # Re-running an import skips rows whose key is already present
+        return self._insert(data, "INSERT OR IGNORE")
+
+    def update_many(self, updates):
+        # All updates commit together or not at all
+        key = quote_identifier(self.schema.key)
+        with self._connection() as connection:
+            for record_id, values in updates.items():
+                values = {column: cell_value(value) for column, value in values.items()}
+                if self.schema.timestamp_sources & set(values):
+                    current = self.get(record_id) or {}
+                    values.update(self.schema.epochs({**current, **values}))
+                assignments = ", ".join(f"{quote_identifier(column)} = ?" for column in values)
+                cursor = connection.execute(
+                    f"UPDATE {self.table} SET {assignments} WHERE {key} = ?",
+                    list(values.values()) + [record_id],
+                )
+                if cursor.rowcount == 0:
+                    raise KeyError(f"Not found in {self.schema.name}: {record_id}")
+
+        edited_columns = {column for values in updates.values() for column in values}
+        if edited_columns & set(self.schema.text_columns):
+            # Not something the admin console edits; rebuild on the next search
+            with self._search_lock:
+                self._search = None
+
+
+def build_store(settings, sheet_store):
+    # settings is the [storage] secrets section: backend = "gsheets" | "sqlite" | "memory"
+    # and sqlite_path
+    if settings.get("backend", "gsheets") != "sqlite":
+        return sheet_store
+    return SQLiteStore(settings.get("sqlite_path", DEFAULT_SQLITE_PATH), sheet_store.schema)
+
+
+def mirrors_to_sheets(settings):
+    # With backend = "sqlite", mirror_to_sheets keeps the worksheets updated as a copy;
+    # the submission queue writes it as a second target of each journal entry
+    return settings.get("backend", "gsheets") == "sqlite" and settings.get("mirror_to_sheets", True)
@@ -0,0 +1,21 @@
+import os
+import sys
+
+# The app's modules live at the repository root, next to app.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import TICKET_SCHEMA  # noqa: E402
+
+
+def ticket(ticket_id, employee_code="E1", **fields):
+    """A Tickets record with every sheet column, in sheet order; fields set other columns by name.
+
+    Open and raised 01-06-2025 10:00:00 unless fields say otherwise. Columns with
+    spaces are passed as **{"Date Raised": ...}; list(record.values()) is the sheet row.
+    """
+    record = {column: "" for column in TICKET_SCHEMA.columns}
+    record.update({
+        "Ticket ID": ticket_id, "Raised By (Employee Code)": employee_code, "Status": "Open",
+        "Date Raised": "01-06-2025", "Time Raised": "10:00:00", **fields,
+    })
+    return record
@@ -0,0 +1,79 @@
+import importlib
+import sys
+from datetime import date, timedelta
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from directory import Employee, EmployeeDirectory
+
+DIRECTORY = EmployeeDirectory([
+    Employee("Asha Rao", "E001", "Engineer", "IT"),
+    Employee("Ravi Kumar", "E002", "Analyst", "Finance"),
+])
+TOMORROW = (date.today() + timedelta(days=1)).strftime("%d-%m-%Y")
+LATER = (date.today() + timedelta(days=3)).strftime("%d-%m-%Y")
+
+
+@pytest.fixture
+def bookings():
+    # The view module builds the shared stores and submission queue on import;
+    # neither is used by build_bulk_booking_records, and the portal modules
+    # imported here are dropped again so later tests import the real ones
+    loaded = set(sys.modules)
+    with mock.patch("portal.resources.get_stores", return_value=(None, None)), \
+            mock.patch("portal.resources.get_submission_queue"):
+        module = importlib.import_module("portal.views.bookings")
+    with mock.patch.object(module, "get_roster", return_value=mock.Mock(get=lambda: DIRECTORY)):
+        yield module
+    for name in set(sys.modules) - loaded:
+        if name.startswith("portal"):
+            del sys.modules[name]
+
+
+def row(employee_code, request_type="Hotel", **fields):
+    values = {
+        "Employee Code": employee_code, "Request Type": request_type, "Email": "a@example.com",
+        "Phone": "9876543210", "Adhara Number": "123412341234", "Hotel Name": "Hotel One",
+        "Check In Date": TOMORROW, "Check Out Date": LATER, "Travel Mode": "Train",
+        "From Location": "Pune", "To Location": "Mumbai", "Booking Date": TOMORROW, "Remarks": "",
+    }
+    return {**values, **fields}
+
+
+BLANK = dict.fromkeys(row(""), "")
+
+
+def test_a_valid_trip_becomes_one_record_per_traveller(bookings):
+    trip = pd.DataFrame([row("E001"), row("E002", "Travel & Hotel"), BLANK])
+
+    records, errors = bookings.build_bulk_booking_records(trip)
+
+    assert errors == []
+    # The blank row the editor leaves at the bottom is ignored
+    assert [(record["Employee Name"], record["Request Type"]) for record in records] == [
+        ("Asha Rao", "Hotel"), ("Ravi Kumar", "Travel & Hotel"),
+    ]
+    assert records[0]["Travel Mode"] == "" and records[1]["Travel Mode"] == "Train"
+    assert len({record["Request ID"] for record in records}) == 2
+
+
+def test_one_invalid_row_rejects_the_whole_trip(bookings):
+    trip = pd.DataFrame([
+        row("E001"),
+        row("E999", "Travel", **{"Booking Date": "2020-01-01"}),
+        row("E002", **{"Check Out Date": TOMORROW, "Check In Date": LATER}),
+    ])
+
+    records, errors = bookings.build_bulk_booking_records(trip)
+
+    assert records == []
+    assert errors == [
+        "Row 2: unknown employee code 'E999'; booking date must be DD-MM-YYYY and not in the past",
+        "Row 3: check in must not be in the past and check out must not be before check in",
+    ]
+
+
+def test_a_trip_of_blank_rows_is_rejected(bookings):
+    assert bookings.build_bulk_booking_records(pd.DataFrame([BLANK, BLANK])) == ([], ["Add at least one traveller."])
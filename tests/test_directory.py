@@ -0,0 +1,23 @@
+import logging
+
+from directory import EmployeeDirectory
+
+ROSTER = """Employee Name,Employee Code,Designation,Department
+Asha Rao,E001,Engineer,IT
+Ravi Kumar,E002
+Meena Shah
+,E004,Analyst,Finance
+Asha Rao,E005,Manager,HR,extra
+"""
+
+
+def test_ragged_rows_are_read_and_rows_without_a_code_skipped(caplog):
+    with caplog.at_level(logging.WARNING, logger="directory"):
+        directory = EmployeeDirectory.parse(ROSTER.splitlines(keepends=True))
+
+    assert sorted(directory.by_code) == ["E001", "E002", "E005"]
+    ravi = directory.get("E002")
+    assert (ravi.name, ravi.designation, ravi.department) == ("Ravi Kumar", "", "")
+    assert "Meena Shah" not in directory.by_name
+    assert "Skipping Meena Shah on roster line 4: no employee code" in caplog.text
+    assert directory.authenticate("Asha Rao", "E005").designation == "Manager"
@@ -0,0 +1,17 @@
+import io
+
+import pandas as pd
+import pytest
+
+from export import EXPORT_FORMATS, export_bytes
+
+READERS = {"CSV": pd.read_csv, "Excel": pd.read_excel, "Parquet": pd.read_parquet}
+
+
+@pytest.mark.parametrize("export_format", list(EXPORT_FORMATS))
+def test_export_bytes_writes_every_chunk(export_format):
+    chunks = [pd.DataFrame({"Ticket ID": ["TKT-1", "TKT-2"]}), pd.DataFrame({"Ticket ID": ["TKT-3"]})]
+
+    data = export_bytes(iter(chunks), export_format)
+
+    assert READERS[export_format](io.BytesIO(data))["Ticket ID"].tolist() == ["TKT-1", "TKT-2", "TKT-3"]
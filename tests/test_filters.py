@@ -0,0 +1,74 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from conftest import ticket
+from storage import TICKET_SCHEMA, MemoryBackend, OlderThan, Range, SheetStore, SQLiteStore, merge_filters
+
+NOW = datetime(2025, 6, 10, 12, 0)
+SLA_HOURS = {"Low": 96, "High": 24}
+OVERDUE = {"Status": "Open", "Raised At": [OlderThan("Priority", SLA_HOURS, now=NOW)]}
+
+# Ticket ID, employee, status, priority, date raised, time raised
+TICKETS = [
+    ("TKT-01", "E1", "Open", "High", "01-06-2025", "09:00:00"),
+    ("TKT-02", "E1", "Resolved", "Low", "03-06-2025", "10:00:00"),
+    ("TKT-03", "E2", "Open", "Low", "05-06-2025", "11:00:00"),
+    ("TKT-04", "E1", "Open", "Low", "07-06-2025", "12:00:00"),
+    ("TKT-05", "E2", "Open", "High", "09-06-2025", "08:00:00"),
+    ("TKT-06", "E1", "Open", "High", "09-06-2025", "13:00:00"),
+    ("TKT-07", "E1", "Resolved", "High", "10-06-2025", "09:30:00"),
+    ("TKT-08", "E1", "Open", "Medium", "02-06-2025", "09:00:00"),
+    ("TKT-09", "E1", "Open", "High", "", ""),
+]
+
+
+def records():
+    return [
+        ticket(ticket_id, employee_code, Status=status, Priority=priority,
+               **{"Date Raised": date_raised, "Time Raised": time_raised})
+        for ticket_id, employee_code, status, priority, date_raised, time_raised in TICKETS
+    ]
+
+
+@pytest.fixture
+def stores(tmp_path):
+    sheet = SheetStore(MemoryBackend({TICKET_SCHEMA.name: [list(record.values()) for record in records()]}), TICKET_SCHEMA)
+    sqlite = SQLiteStore(str(tmp_path / "portal.db"), TICKET_SCHEMA)
+    sqlite.import_frame(pd.DataFrame(records()))
+    return sheet, sqlite
+
+
+FILTERS = {
+    "range": ({"Raised At": [Range(datetime(2025, 6, 3), datetime(2025, 6, 9))]}, ["TKT-04", "TKT-03", "TKT-02"]),
+    "open ended range": ({"Raised At": [Range(datetime(2025, 6, 9, 12))]}, ["TKT-07", "TKT-06"]),
+    "older than": ({"Raised At": [OlderThan("Priority", SLA_HOURS, now=NOW)]}, ["TKT-05", "TKT-03", "TKT-02", "TKT-01"]),
+    "overdue": (OVERDUE, ["TKT-05", "TKT-03", "TKT-01"]),
+    "overdue in a range": (
+        merge_filters({"Raised At": [Range(datetime(2025, 6, 2))]}, OVERDUE), ["TKT-05", "TKT-03"]
+    ),
+    "overdue and open": (merge_filters({"Status": "Open"}, OVERDUE), ["TKT-05", "TKT-03", "TKT-01"]),
+    "overdue but resolved": (merge_filters({"Status": "Resolved"}, OVERDUE), []),
+    "status and priority": ({"Status": "Open", "Priority": "High"}, ["TKT-06", "TKT-05", "TKT-01", "TKT-09"]),
+}
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def test_both_stores_filter_alike(stores, name):
+    filters, expected = FILTERS[name]
+    for store in stores:
+        assert list(store.select(filters)["Ticket ID"]) == expected
+        assert store.count("E1", filters) == len([ticket_id for ticket_id in expected if ticket_id not in ("TKT-03", "TKT-05")])
+
+
+def test_pages_of_a_filtered_selection_match(stores):
+    filters = {"Raised At": [Range(datetime(2025, 6, 1), NOW)]}
+    for store in stores:
+        assert list(store.select(filters, offset=1, limit=3)["Ticket ID"]) == ["TKT-06", "TKT-05", "TKT-04"]
+        assert list(store.page("E1", {"Status": "Open"}, offset=1, limit=2)["Ticket ID"]) == ["TKT-04", "TKT-08"]
+
+
+def test_merged_filters_keep_every_condition():
+    assert merge_filters({"Status": "Open"}, {"Status": "Open"}) == {"Status": "Open"}
+    assert merge_filters({"Status": "Resolved"}, OVERDUE)["Status"] == ["Resolved", "Open"]
@@ -0,0 +1,41 @@
+import threading
+
+from ids import IdGenerator
+
+THREADS = 8
+IDS_PER_THREAD = 250_000
+PROCESSES = 4
+
+
+def generate(generators):
+    # One thread per generator entry; returns each thread's IDs in the order they were made
+    results = [None] * len(generators)
+
+    def run(number):
+        generate_id = generators[number]
+        results[number] = [generate_id() for _ in range(IDS_PER_THREAD)]
+
+    threads = [threading.Thread(target=run, args=(number,)) for number in range(len(generators))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_two_million_ids_across_threads_are_unique_and_increasing():
+    generate_id = IdGenerator("TKT")
+    results = generate([generate_id] * THREADS)
+
+    ids = [ticket_id for thread_ids in results for ticket_id in thread_ids]
+    assert len(set(ids)) == THREADS * IDS_PER_THREAD
+    for thread_ids in results:
+        assert all(earlier < later for earlier, later in zip(thread_ids, thread_ids[1:]))
+
+
+def test_ids_from_separate_processes_do_not_collide():
+    # Each server process has its own generator; only the random bits keep them apart
+    results = generate([IdGenerator("TKT") for _ in range(PROCESSES)])
+
+    ids = [ticket_id for thread_ids in results for ticket_id in thread_ids]
+    assert len(set(ids)) == PROCESSES * IDS_PER_THREAD
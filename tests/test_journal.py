@@ -0,0 +1,48 @@
+import json
+
+from journal import SubmissionJournal
+
+
+def lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_each_process_gets_its_own_journal(tmp_path):
+    path = str(tmp_path / "submissions.journal")
+    first, second = SubmissionJournal(path), SubmissionJournal(path)
+    assert first.path != second.path
+
+    kept = first.add("Tickets", [{"Ticket ID": "TKT-1"}])
+    synced = second.add("Tickets", [{"Ticket ID": "TKT-2"}])
+    # The second one has nothing left pending; that must not touch the first one's file
+    second.ack([synced])
+
+    assert [entry["entry"] for entry in lines(first.path)] == [kept]
+    assert lines(second.path) == []
+
+
+def test_journals_of_stopped_processes_are_adopted_once(tmp_path):
+    path = str(tmp_path / "submissions.journal")
+    first, second = SubmissionJournal(path), SubmissionJournal(path)
+    first_id = first.add("Tickets", [{"Ticket ID": "TKT-1"}])
+    second_id = second.add("Tickets", [{"Ticket ID": "TKT-2"}])
+    first.close()
+    second.close()
+
+    restarted = SubmissionJournal(path)
+    other = SubmissionJournal(path)
+
+    assert {entry["entry"] for entry in restarted.pending()} == {first_id, second_id}
+    assert other.pending() == []
+
+
+def test_compaction_keeps_only_pending_entries(tmp_path):
+    journal = SubmissionJournal(str(tmp_path / "submissions.journal"), compact_after=4)
+    entry_ids = [journal.add("Tickets", [{"Ticket ID": f"TKT-{number}"}]) for number in range(4)]
+
+    journal.ack(entry_ids[:1])
+
+    assert [entry["entry"] for entry in lines(journal.path)] == entry_ids[1:]
+    journal.close()
+    assert {entry["entry"] for entry in SubmissionJournal(journal.path).pending()} == set(entry_ids[1:])
@@ -0,0 +1,13 @@
+from loadtest import run_load
+
+
+def test_concurrent_sessions_submit_every_record_once():
+    result = run_load(users=8, iterations=2, latency=0.01, jitter=0.01)
+
+    assert result["errors"] == []
+    assert result["synced"]
+    assert len(result["timings"]["submit_ticket"]) == 16
+    for audit in result["audit"].values():
+        assert not audit["lost"] and not audit["duplicated"] and not audit["unexpected"]
+    assert result["audit"]["Tickets"]["rows"] == 16
+    assert result["audit"]["TravelHotelRequests"]["rows"] == 32
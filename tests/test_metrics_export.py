@@ -0,0 +1,23 @@
+import socket
+
+import streamlit as st
+
+from portal import resources
+
+
+def test_metrics_export_survives_a_taken_port(monkeypatch, caplog):
+    started = []
+    monkeypatch.setattr(resources, "start_textfile_writer", lambda *args: started.append(args))
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        port = taken.getsockname()[1]
+        monkeypatch.setattr(st, "secrets", {"metrics": {"port": port, "textfile": "portal.prom"}})
+        resources.start_metrics_export.clear()
+
+        assert resources.start_metrics_export() is True
+        # Reruns get the cached result instead of retrying the bind and the textfile thread
+        assert resources.start_metrics_export() is True
+
+    assert len(started) == 1
+    assert f"Could not serve metrics on 127.0.0.1:{port}" in caplog.text
@@ -0,0 +1,111 @@
+import threading
+import time
+
+from cache import KeyIndex, SheetCache
+
+
+class SlowSheet:
+    """Load function for SheetCache whose loads after the first wait for release()."""
+
+    def __init__(self, rows, delay=0):
+        self.rows = rows
+        self.delay = delay
+        self.loads = 0
+        self.loading = threading.Event()
+        self._release = threading.Event()
+
+    def __call__(self):
+        self.loads += 1
+        time.sleep(self.delay)
+        rows = [list(row) for row in self.rows]
+        if self.loads > 1:
+            self.loading.set()
+            self._release.wait(5)
+        return rows, list(range(2, len(rows) + 2))
+
+    def release(self):
+        self._release.set()
+
+
+def wait_for_refresh():
+    for thread in threading.enumerate():
+        if thread.name == "sheet-cache-refresh":
+            thread.join(5)
+
+
+def test_stale_copy_is_served_while_one_refresh_runs():
+    sheet = SlowSheet([["TKT-1", "E1"]])
+    cache = SheetCache(sheet, 0, max_staleness=0)
+    cache.rows()
+    sheet.rows = [["TKT-1", "E1"], ["TKT-2", "E1"]]
+
+    for _ in range(20):
+        assert cache.rows() == [["TKT-1", "E1"]]
+    assert sheet.loading.wait(5)
+    assert sheet.loads == 2
+
+    sheet.release()
+    wait_for_refresh()
+    assert [row[0] for row in cache.rows()] == ["TKT-1", "TKT-2"]
+
+
+def test_writes_during_a_reload_reach_the_new_copy():
+    sheet = SlowSheet([["TKT-1", "E1"]])
+    cache = SheetCache(sheet, 0)
+    by_employee = cache.add_index(KeyIndex(1))
+    cache.rows()
+    reload = threading.Thread(target=cache.reload)
+    reload.start()
+    assert sheet.loading.wait(5)
+
+    # Written after the reload read the sheet, so its load does not contain them
+    cache.append([["TKT-2", "E1"]], first_row=3)
+    cache.update({"TKT-1": {1: "E2"}})
+    sheet.release()
+    reload.join()
+
+    assert sheet.loads == 2
+    assert cache.rows() == [["TKT-1", "E2"], ["TKT-2", "E1"]]
+    assert cache.lookup(by_employee, "E1") == [["TKT-2", "E1"]]
+    assert cache.locate(["TKT-2"]) == {"TKT-2": 3}
+
+
+def test_concurrent_first_readers_share_one_load():
+    sheet = SlowSheet([["TKT-1", "E1"]], delay=0.1)
+    cache = SheetCache(sheet, 0)
+    threads = [threading.Thread(target=cache.rows) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sheet.loads == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_readers_keep_the_old_indexes_while_new_ones_are_built():
+    building, release = threading.Event(), threading.Event()
+
+    class SlowIndex(KeyIndex):
+        def empty(self):
+            return SlowIndex(self.position)
+
+        def rebuild(self, rows):
+            if len(rows) > 1:
+                building.set()
+                release.wait(5)
+            super().rebuild(rows)
+
+    sheet = [["TKT-1", "E1"]]
+    cache = SheetCache(lambda: ([list(row) for row in sheet], list(range(2, len(sheet) + 2))), 0)
+    by_employee = cache.add_index(SlowIndex(1))
+    cache.rows()
+    sheet.append(["TKT-2", "E1"])
+    reload = threading.Thread(target=cache.reload)
+    reload.start()
+    assert building.wait(5)
+
+    assert cache.lookup(by_employee, "E1") == [["TKT-1", "E1"]]
+    release.set()
+    reload.join()
+    assert cache.lookup(by_employee, "E1") == [["TKT-1", "E1"], ["TKT-2", "E1"]]
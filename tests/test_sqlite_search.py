@@ -0,0 +1,36 @@
+import pandas as pd
+
+from conftest import ticket
+from storage import TICKET_SCHEMA, SQLiteStore
+
+
+def frame(ticket_id, details, employee_code="E1", **fields):
+    return pd.DataFrame([ticket(ticket_id, employee_code, Details=details, **fields)])
+
+
+def found(store, text, **kwargs):
+    return sorted(store.search(text, **kwargs)["Ticket ID"])
+
+
+def test_search_sees_rows_written_by_another_process(tmp_path):
+    path = str(tmp_path / "portal.db")
+    server, other = SQLiteStore(path, TICKET_SCHEMA), SQLiteStore(path, TICKET_SCHEMA)
+    server.append(frame("TKT-1", "printer jammed"))
+    assert found(server, "printer") == ["TKT-1"]
+
+    # Another server process, and migrate.py's import, write to the same database
+    other.append(frame("TKT-2", "printer offline"))
+    other.import_frame(frame("TKT-3", "printer toner"))
+
+    assert found(server, "printer") == ["TKT-1", "TKT-2", "TKT-3"]
+
+
+def test_search_filters_apply_to_the_matching_rows(tmp_path):
+    store = SQLiteStore(str(tmp_path / "portal.db"), TICKET_SCHEMA)
+    store.append(frame("TKT-1", "vpn down"))
+    store.append(frame("TKT-2", "vpn slow", Status="Resolved"))
+    store.append(frame("TKT-3", "vpn down", "E2"))
+    store.append(frame("TKT-4", "laptop broken"))
+
+    assert found(store, "vpn", employee_code="E1", filters={"Status": "Open"}) == ["TKT-1"]
+    assert found(store, "vpn", filters={"Status": "Open"}) == ["TKT-1", "TKT-3"]
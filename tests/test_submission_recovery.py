@@ -0,0 +1,96 @@
+import threading
+import time
+
+from conftest import ticket
+from journal import SubmissionJournal, SubmissionQueue
+from storage import TICKET_SCHEMA, MemoryBackend, SheetStore, SQLiteStore, WriteCoordinator
+
+THREADS = 50
+TICKETS_PER_THREAD = 20
+
+
+def start_queue(backend, journal):
+    store = SheetStore(backend, TICKET_SCHEMA, writer=WriteCoordinator(backend))
+    # A short backoff keeps the test quick; the retry logic is the same
+    return SubmissionQueue(journal, {TICKET_SCHEMA.name: store}, batch_size=50, max_backoff=0.02)
+
+
+def wait_until_synced(journal, timeout=60):
+    deadline = time.monotonic() + timeout
+    while journal.pending() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return not journal.pending()
+
+
+def test_submissions_survive_random_backend_failures(tmp_path):
+    backend = MemoryBackend(failure_rate=0.2, after_write_failure_rate=0.2, seed=3)
+    journal = SubmissionJournal(str(tmp_path / "submissions.journal"))
+    submissions = start_queue(backend, journal)
+    ticket_ids = [f"TKT-{thread:03d}-{number:03d}" for thread in range(THREADS) for number in range(TICKETS_PER_THREAD)]
+
+    def submit(thread):
+        for ticket_id in ticket_ids[thread * TICKETS_PER_THREAD:(thread + 1) * TICKETS_PER_THREAD]:
+            submissions.submit(TICKET_SCHEMA.name, [ticket(ticket_id)])
+
+    threads = [threading.Thread(target=submit, args=(thread,)) for thread in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert wait_until_synced(journal)
+    audit = backend.audit(TICKET_SCHEMA.name, ticket_ids)
+    assert audit["rows"] == len(ticket_ids)
+    assert not audit["lost"] and not audit["duplicated"] and not audit["unexpected"]
+    with open(journal.path, encoding="utf-8") as f:
+        assert f.read() == ""
+
+
+def test_entries_left_by_a_crash_are_replayed_once(tmp_path):
+    path = str(tmp_path / "submissions.journal")
+    crashed = SubmissionJournal(path)
+    ticket_ids = [f"TKT-{number:03d}" for number in range(100)]
+    for ticket_id in ticket_ids:
+        crashed.add(TICKET_SCHEMA.name, [ticket(ticket_id)])
+    crashed.close()
+    # The first half reached the sheet before the crash, but was never acknowledged
+    backend = MemoryBackend(
+        {TICKET_SCHEMA.name: [list(ticket(ticket_id).values()) for ticket_id in ticket_ids[:50]]},
+        failure_rate=0.2, after_write_failure_rate=0.2, seed=4,
+    )
+
+    journal = SubmissionJournal(path)
+    start_queue(backend, journal)
+
+    assert wait_until_synced(journal)
+    audit = backend.audit(TICKET_SCHEMA.name, ticket_ids)
+    assert audit["rows"] == len(ticket_ids)
+    assert not audit["lost"] and not audit["duplicated"] and not audit["unexpected"]
+
+
+def test_mirror_gets_every_submission_and_edit_in_order(tmp_path):
+    backend = MemoryBackend(failure_rate=0.5, seed=5)
+    store = SQLiteStore(str(tmp_path / "portal.db"), TICKET_SCHEMA)
+    mirror = SheetStore(backend, TICKET_SCHEMA, writer=WriteCoordinator(backend))
+    journal = SubmissionJournal(str(tmp_path / "submissions.journal"))
+    submissions = SubmissionQueue(
+        journal, {TICKET_SCHEMA.name: store}, {TICKET_SCHEMA.name: mirror}, batch_size=5, max_backoff=0.02
+    )
+    ticket_ids = [f"TKT-{number:03d}" for number in range(20)]
+    for ticket_id in ticket_ids:
+        submissions.submit(TICKET_SCHEMA.name, [ticket(ticket_id)])
+    # The store has the tickets once their entries are acked for it; each edit
+    # must reach the mirror after the append it edits, and the second edit last
+    while journal.pending(target="store"):
+        time.sleep(0.01)
+    submissions.update(TICKET_SCHEMA.name, {ticket_ids[0]: {"Status": "Resolved"}})
+    submissions.update(TICKET_SCHEMA.name, {ticket_ids[0]: {"Status": "Open", "Subject": "Reopened"}})
+
+    assert wait_until_synced(journal)
+    assert len(store.select()) == len(ticket_ids)
+    audit = backend.audit(TICKET_SCHEMA.name, ticket_ids)
+    assert audit["rows"] == len(ticket_ids)
+    assert not audit["lost"] and not audit["duplicated"] and not audit["unexpected"]
+    backend.failure_rate = 0
+    mirrored = SheetStore(backend, TICKET_SCHEMA).get(ticket_ids[0])
+    assert (mirrored["Status"], mirrored["Subject"]) == ("Open", "Reopened")
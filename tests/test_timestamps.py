@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from conftest import ticket
+from storage import TICKET_SCHEMA, MemoryBackend, SheetStore, SQLiteStore, parse_epoch, parse_epochs, to_epoch
+
+
+def test_parse_epochs_matches_parse_epoch_row_by_row():
+    dates = pd.Series(["31-05-2025", "01-06-2025", "01-06-2025", "31-12-2024", "2025-06-01", ""])
+    times = pd.Series(["23:59:59", "00:00:00", "", "10:00:00", "10:00:00", "10:00:00"])
+
+    epochs = parse_epochs(dates, times)
+
+    assert epochs == [parse_epoch(date, time) for date, time in zip(dates, times)]
+    assert epochs[:4] == [
+        to_epoch(datetime(2025, 5, 31, 23, 59, 59)),
+        to_epoch(datetime(2025, 6, 1)),
+        # A missing time falls back to the date alone
+        to_epoch(datetime(2025, 6, 1)),
+        to_epoch(datetime(2024, 12, 31, 10)),
+    ]
+    # Only DD-MM-YYYY is a sheet date
+    assert epochs[4:] == [None, None]
+    assert parse_epochs(dates[:2]) == [to_epoch(datetime(2025, 5, 31)), to_epoch(datetime(2025, 6, 1))]
+
+
+# Raised on these dates, in sheet order; as text "31-..." sorts after "01-..."
+RAISED = [
+    ("TKT-A", "15-05-2025"),
+    ("TKT-B", "01-06-2025"),
+    ("TKT-C", "31-05-2025"),
+    ("TKT-D", "02-01-2026"),
+    ("TKT-E", "31-12-2025"),
+]
+
+
+def load(kind, records, tmp_path):
+    if kind == "sheet":
+        rows = [list(record.values()) for record in records]
+        return SheetStore(MemoryBackend({TICKET_SCHEMA.name: rows}), TICKET_SCHEMA)
+    store = SQLiteStore(str(tmp_path / "portal.db"), TICKET_SCHEMA)
+    store.import_frame(pd.DataFrame(records))
+    return store
+
+
+@pytest.mark.parametrize("kind", ["sheet", "sqlite"])
+def test_history_is_newest_first_across_months_and_years(kind, tmp_path):
+    store = load(kind, [ticket(ticket_id, **{"Date Raised": raised}) for ticket_id, raised in RAISED], tmp_path)
+
+    assert list(store.page("E1")["Ticket ID"]) == ["TKT-D", "TKT-E", "TKT-B", "TKT-C", "TKT-A"]
+    assert list(store.page("E1", offset=1, limit=2)["Ticket ID"]) == ["TKT-E", "TKT-B"]
@@ -0,0 +1,38 @@
+import pytest
+
+from conftest import ticket
+from storage import TICKET_SCHEMA, MemoryBackend, SheetStore
+
+
+def loaded_store(ticket_ids):
+    backend = MemoryBackend({TICKET_SCHEMA.name: [list(ticket(ticket_id).values()) for ticket_id in ticket_ids]})
+    store = SheetStore(backend, TICKET_SCHEMA)
+    store.cache.rows()
+    return backend, store
+
+
+def statuses(backend):
+    status = TICKET_SCHEMA.columns.index("Status")
+    return {row[0]: row[status] for row in backend.sheets[TICKET_SCHEMA.name]}
+
+
+def test_update_follows_rows_moved_by_hand_since_the_copy_was_loaded():
+    backend, store = loaded_store(["TKT-1", "TKT-2", "TKT-3"])
+    # An admin sorts the sheet and inserts a row after the shared copy was loaded
+    backend.sheets[TICKET_SCHEMA.name].reverse()
+    backend.sheets[TICKET_SCHEMA.name].insert(0, list(ticket("TKT-0").values()))
+
+    store.update_many({"TKT-1": {"Status": "Resolved"}})
+
+    assert statuses(backend) == {"TKT-0": "Open", "TKT-1": "Resolved", "TKT-2": "Open", "TKT-3": "Open"}
+    assert store.get("TKT-1")["Status"] == "Resolved"
+
+
+def test_update_of_a_deleted_ticket_writes_nothing():
+    backend, store = loaded_store(["TKT-1", "TKT-2"])
+    del backend.sheets[TICKET_SCHEMA.name][0]
+
+    with pytest.raises(KeyError):
+        store.update_many({"TKT-1": {"Status": "Resolved"}, "TKT-2": {"Status": "Resolved"}})
+
+    assert statuses(backend) == {"TKT-2": "Open"}
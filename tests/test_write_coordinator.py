@@ -0,0 +1,80 @@
+import threading
+
+import pandas as pd
+
+from conftest import ticket
+from storage import TICKET_SCHEMA, MemoryBackend, SheetStore, WriteCoordinator
+
+THREADS = 50
+TICKETS_PER_THREAD = 20
+
+
+class CountingBackend(MemoryBackend):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.append_calls = 0
+
+    def append_rows(self, worksheet, rows):
+        self.append_calls += 1
+        return super().append_rows(worksheet, rows)
+
+
+def stress_ticket(thread, number):
+    return ticket(f"TKT-{thread:03d}-{number:03d}", f"E{thread:03d}", Subject="Stress")
+
+
+def submit_concurrently(store):
+    start = threading.Barrier(THREADS)
+    first_rows, errors = [], []
+
+    def submit(thread):
+        start.wait()
+        for number in range(TICKETS_PER_THREAD):
+            try:
+                first_rows.append(store.append(pd.DataFrame([stress_ticket(thread, number)])))
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=submit, args=(thread,)) for thread in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return first_rows, errors
+
+
+def expected_keys():
+    return [stress_ticket(thread, number)["Ticket ID"] for thread in range(THREADS) for number in range(TICKETS_PER_THREAD)]
+
+
+def test_concurrent_submissions_become_exactly_one_row_each():
+    backend = CountingBackend(latency=0.005, jitter=0.005, seed=1)
+    store = SheetStore(backend, TICKET_SCHEMA, writer=WriteCoordinator(backend))
+    store.cache.rows()
+
+    first_rows, errors = submit_concurrently(store)
+
+    assert not errors
+    audit = backend.audit(TICKET_SCHEMA.name, expected_keys())
+    assert audit["rows"] == THREADS * TICKETS_PER_THREAD
+    assert not audit["lost"] and not audit["duplicated"] and not audit["unexpected"]
+    # Every caller is told the sheet row its ticket landed on
+    assert sorted(first_rows) == list(range(2, THREADS * TICKETS_PER_THREAD + 2))
+    # Submissions waiting behind an in-flight request share the next append
+    assert backend.append_calls < THREADS * TICKETS_PER_THREAD
+    # The shared copy holds every row without a reload
+    assert len(store.cache.rows()) == THREADS * TICKETS_PER_THREAD
+
+
+def test_failed_append_fails_every_caller_in_the_batch():
+    backend = CountingBackend(latency=0.005, failure_rate=0.3, seed=2)
+    store = SheetStore(backend, TICKET_SCHEMA, writer=WriteCoordinator(backend))
+
+    first_rows, errors = submit_concurrently(store)
+
+    # A caller either gets its row number or the error; a failed batch writes nothing
+    assert len(first_rows) + len(errors) == THREADS * TICKETS_PER_THREAD
+    assert all(isinstance(error, ConnectionError) for error in errors)
+    audit = backend.audit(TICKET_SCHEMA.name, expected_keys())
+    assert audit["rows"] == len(first_rows)
+    assert not audit["duplicated"] and not audit["unexpected"]